@@ -5,16 +5,47 @@ Refactored to use dataclasses on 2025-10-16
 """
 
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from typing import Optional, Dict
 
 from categoriae.ontology import PersistableEntity
 
 
-@dataclass
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def naive_utc(moment: datetime) -> datetime:
+    """
+    Drop the timezone from an aware datetime after converting it to UTC.
+
+    Stored log times are naive, so a bound parsed from an ISO string ending
+    in 'Z' or '+00:00' must be normalized before it is compared with them.
+    Naive datetimes are returned unchanged.
+    """
+    if moment.tzinfo is not None:
+        return moment.astimezone(timezone.utc).replace(tzinfo=None)
+    return moment
+
+
+def to_ticks(moment: datetime) -> int:
+    """
+    Integer microseconds since the Unix epoch.
+
+    Ticks order exactly like the datetimes they came from, so range checks and
+    sorts can compare plain ints instead of calling datetime.__lt__. Aware
+    datetimes are converted to UTC first (see naive_utc).
+    """
+    return (naive_utc(moment) - _EPOCH) // _MICROSECOND
+
+
+@dataclass(slots=True)
 class Action(PersistableEntity):
     """
     An action taken at a point in time.
+
+    Slotted: actions are created in bulk (imports, inference passes), so
+    dropping the per-instance __dict__ keeps memory and attribute access lean.
     """
 
     measurement_units_by_amount: Optional[Dict[str, float]] = None
@@ -25,12 +56,12 @@ class Action(PersistableEntity):
         """Validate that this action meets core requirements"""
         if not self.log_time:
             return False
-        if self.measurement_units_by_amount:
-            # Check that all measurement values are positive
-            for value in self.measurement_units_by_amount.values():
-                if value <= 0:
-                    return False
+        measurements = self.measurement_units_by_amount
+        # All measurement values must be positive - min() reduces in C
+        if measurements and min(measurements.values()) <= 0:
+            return False
         # If start_time exists, duration should too
         if self.start_time and not self.duration_minutes:
             return False
         return True
+
@@ -8,7 +8,6 @@ Refactored to use dataclasses on 2025-10-16
 
 """
 
-from abc import ABC
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Optional
@@ -122,27 +121,9 @@ class SmartGoal(Goal):
 
     def __post_init__(self):
         """Validate SMART criteria after initialization"""
-        # Validate Measurable
-        if not self.measurement_unit or not self.measurement_unit.strip():
-            raise ValueError("SmartGoal requires measurement_unit (Measurable)")
-
-        # Validate Achievable - need to check for None first since Optional[float]
-        if self.measurement_target is None or self.measurement_target <= 0:
-            raise ValueError(f"SmartGoal target must be positive, got {self.measurement_target} (Achievable)")
-
-        # Validate Time-bound - need to check for None first
-        if self.start_date is None or self.target_date is None:
-            raise ValueError("SmartGoal requires both start_date and target_date (Time-bound)")
-        if self.start_date >= self.target_date:
-            raise ValueError("SmartGoal start_date must be before target_date (Time-bound)")
-
-        # Validate Relevant
-        if not self.how_goal_is_relevant or not self.how_goal_is_relevant.strip():
-            raise ValueError("SmartGoal requires relevance statement (Relevant)")
-
-        # Validate Achievable (actionable)
-        if not self.how_goal_is_actionable or not self.how_goal_is_actionable.strip():
-            raise ValueError("SmartGoal requires how_goal_is_actionable statement (Achievable)")
+        _validate_smart(self.measurement_unit, self.measurement_target,
+                        self.start_date, self.target_date,
+                        self.how_goal_is_relevant, self.how_goal_is_actionable)
 
     @property
     def is_smart(self) -> bool:
@@ -150,6 +131,36 @@ class SmartGoal(Goal):
         return True
 
 
+def _validate_smart(measurement_unit, measurement_target, start_date, target_date,
+                    how_goal_is_relevant, how_goal_is_actionable) -> None:
+    """
+    Raise ValueError if the arguments don't satisfy the SMART criteria.
+
+    Blank checks use isspace() rather than strip() so nothing is allocated.
+    """
+    # Validate Measurable
+    if not measurement_unit or measurement_unit.isspace():
+        raise ValueError("SmartGoal requires measurement_unit (Measurable)")
+
+    # Validate Achievable - need to check for None first since Optional[float]
+    if measurement_target is None or measurement_target <= 0:
+        raise ValueError(f"SmartGoal target must be positive, got {measurement_target} (Achievable)")
+
+    # Validate Time-bound - need to check for None first
+    if start_date is None or target_date is None:
+        raise ValueError("SmartGoal requires both start_date and target_date (Time-bound)")
+    if start_date >= target_date:
+        raise ValueError("SmartGoal start_date must be before target_date (Time-bound)")
+
+    # Validate Relevant
+    if not how_goal_is_relevant or how_goal_is_relevant.isspace():
+        raise ValueError("SmartGoal requires relevance statement (Relevant)")
+
+    # Validate Achievable (actionable)
+    if not how_goal_is_actionable or how_goal_is_actionable.isspace():
+        raise ValueError("SmartGoal requires how_goal_is_actionable statement (Achievable)")
+
+
 
 # ===== KEY PATTERNS =====
 #
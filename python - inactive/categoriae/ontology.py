@@ -6,16 +6,20 @@ Children differentiate by adding required fields that define their essence.
 
 Written by Claude Code on 2025-10-16
 Updated by Claude Code on 2025-10-21 to add UUID support
+
+Base classes are slotted so that subclasses which also opt into slots
+(Action, relationships) carry no per-instance __dict__. They are plain
+classes rather than ABCs: nothing here is abstract, and ABCMeta's
+__instancecheck__ hook would slow every isinstance() dispatch on entities.
 """
 
-from abc import ABC
 from dataclasses import dataclass, field
 from typing import Optional
 from datetime import datetime
 from uuid import UUID, uuid4
 
-@dataclass
-class IndependentEntity(ABC):
+@dataclass(slots=True)
+class IndependentEntity:
     title: str
     # UUID and database fields use kw_only to maintain backward compatibility
     # with existing constructors like Values(name, description)
@@ -26,7 +30,7 @@ class IndependentEntity(ABC):
 
 
 
-@dataclass
+@dataclass(slots=True)
 class PersistableEntity(IndependentEntity):
     """
     Base infrastructure for entities that can be stored in database.
@@ -39,8 +43,8 @@ class PersistableEntity(IndependentEntity):
     log_time: datetime = field(default_factory=datetime.now)
 
 
-@dataclass
-class DerivedEntity(ABC):
+@dataclass(slots=True)
+class DerivedEntity:
     """
     Base class for relationships computed from existing entities.
 
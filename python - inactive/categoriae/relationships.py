@@ -4,17 +4,36 @@ Relationship definitions - describe connections between domain entities.
 These are NOT source entities - they represent derived/computed relationships.
 The definitions (data shape) live here in categoriae.
 The logic (how to compute them) lives in ethica.
+
+Relationships are slotted - inference produces one per action/goal pair, and
+with slots=True there is no per-instance __dict__. They are deliberately not
+frozen (or NamedTuples): confirm_suggested_match(in_place=True) updates a
+suggestion's assignment_method and confidence, and the serializer and storage
+layers treat them as ordinary dataclasses.
 """
 
 from dataclasses import dataclass
-
+from enum import StrEnum
 
 from categoriae.actions import Action
 from categoriae.goals import Goal
 from categoriae.ontology import DerivedEntity
 from categoriae.values import MajorValues
 
-@dataclass
+
+class AssignmentMethod(StrEnum):
+    """
+    How a relationship was determined.
+
+    Members are interned singletons that still compare equal to (and store as)
+    their string values, so the database column and API payloads are unchanged.
+    """
+    AUTO_INFERRED = 'auto_inferred'
+    USER_CONFIRMED = 'user_confirmed'
+    MANUAL = 'manual'
+
+
+@dataclass(slots=True)
 class ActionGoalRelationship(DerivedEntity):
     """
     Represents a discovered or assigned relationship between an action and a goal.
@@ -37,11 +56,11 @@ class ActionGoalRelationship(DerivedEntity):
     action: Action
     goal: Goal
     contribution: float
-    assignment_method: str  # 'auto_inferred', 'user_confirmed', 'manual'
+    assignment_method: AssignmentMethod
     confidence: float = 1.0
 
 
-@dataclass
+@dataclass(slots=True)
 class MajorValueAlignment(DerivedEntity):
     """
     Represents alignment between a goal and a personal value.
@@ -70,5 +89,5 @@ class MajorValueAlignment(DerivedEntity):
     goal: Goal
     value: MajorValues
     alignment_strength: float  # 0.0-1.0, distinct from confidence
-    assignment_method: str  # 'auto_inferred', 'user_confirmed', 'manual'
+    assignment_method: AssignmentMethod
     confidence: float = 1.0
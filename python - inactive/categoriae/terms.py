@@ -12,19 +12,52 @@ Written by Claude Code on 2025-10-12
 Refactored to use dataclasses on 2025-10-16
 """
 
-from abc import ABC
+from bisect import bisect_right, insort
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
-from sqlite3 import Time
+from operator import attrgetter
 from typing import Optional, List
 
-from click import Option
-
 from categoriae.ontology import DerivedEntity, IndependentEntity
 
 MN_LIFE_EXPECTANCY_YEARS = 79  # CDC Minnesota life expectancy
 DAYS_PER_YEAR = 365.25 
 
+# Fixed spans hoisted so constructors don't build a new timedelta each time
+TEN_WEEKS = timedelta(weeks=10)
+LIFE_EXPECTANCY = timedelta(days=int(MN_LIFE_EXPECTANCY_YEARS * DAYS_PER_YEAR))
+
+_term_start = attrgetter('start_date')
+
+# Instant pinned by frozen_now(); None means read the clock
+_frozen_now: ContextVar[Optional[datetime]] = ContextVar('frozen_now', default=None)
+
+
+def current_time() -> datetime:
+    """Return datetime.now(), or the instant pinned by an enclosing frozen_now()."""
+    return _frozen_now.get() or datetime.now()
+
+
+@contextmanager
+def frozen_now(instant: Optional[datetime] = None):
+    """
+    Pin "now" for every time-frame calculation inside the block.
+
+    A page that renders many terms reads the clock once and every term agrees
+    on the same instant. Context-local, so concurrent requests don't interfere.
+
+    Example:
+        >>> with frozen_now():
+        ...     rows = [(t.is_active(), t.progress_percentage()) for t in terms]
+    """
+    token = _frozen_now.set(instant or datetime.now())
+    try:
+        yield _frozen_now.get()
+    finally:
+        _frozen_now.reset(token)
+
 @dataclass
 class TimeFrame(IndependentEntity):
     """
@@ -53,13 +86,13 @@ class GoalTerm(TimeFrame):
         term_goal_uuids: List of goal UUIDs associated with this term
         reflection: Post-term reflection notes
     """
-    TEN_WEEKS_IN_DAYS = 70  # 10 weeks × 7 days/week
+    TEN_WEEKS_IN_DAYS = TEN_WEEKS.days  # 10 weeks × 7 days/week
 
     # Override title to have default based on term_number
     title: str = ""  # Will be auto-generated in __post_init__ if empty
     term_number: int = 0
     start_date: datetime = field(default_factory=datetime.today)
-    target_date: datetime = field(default_factory=lambda: datetime.today() + timedelta(days=70))
+    target_date: datetime = field(default_factory=lambda: datetime.today() + TEN_WEEKS)
     description: str = field(default="A focused 10-week period for achieving specific goals")
     term_goals_by_id: List[int] = field(default_factory=list)  # Deprecated - for backward compatibility
     reflection: str = ''
@@ -72,19 +105,19 @@ class GoalTerm(TimeFrame):
 # refactor is_active, days_remaining, progress_percentage to ethica or rhetorica
     def is_active(self, check_date: Optional[datetime] = None) -> bool:
         """Check if term is currently active."""
-        check = check_date or datetime.now()
+        check = check_date or current_time()
         return self.start_date <= check <= self.target_date
 
     def days_remaining(self, from_date: Optional[datetime] = None) -> int:
         """Calculate days remaining in term."""
-        check = from_date or datetime.now()
+        check = from_date or current_time()
         if check > self.target_date:
             return 0
         return (self.target_date - check).days
 
     def progress_percentage(self, from_date: Optional[datetime] = None) -> float:
         """Calculate percentage of term completed (0.0 to 1.0)."""
-        check = from_date or datetime.now()
+        check = from_date or current_time()
         total_days = (self.target_date - self.start_date).days
         elapsed_days = (check - self.start_date).days
 
@@ -109,17 +142,35 @@ class YearlyPlan(TimeFrame):
         terms: List of GoalTerm objects in this year
         annual_theme: Overarching focus (e.g., "Year of Health")
         annual_reflection: End-of-year retrospective
+
+    Terms are kept sorted by start_date so the current term is found by
+    bisection. The list passed in is copied, not sorted in place. Add terms
+    with add_term() to preserve the ordering.
+
+    Terms are expected not to overlap. If they do, get_current_term()
+    considers only the latest-starting term on or before the check date,
+    whereas the original linear scan returned the first active term in list
+    order.
     """
     year: int = date.today().year
     terms: List[GoalTerm] = field(default_factory=list)
     annual_theme: Optional[str] = None
     annual_reflection: Optional[str] = None
 
+    def __post_init__(self):
+        self.terms = sorted(self.terms, key=_term_start)
+
+    def add_term(self, term: GoalTerm) -> None:
+        """Insert a term, keeping terms ordered by start_date."""
+        insort(self.terms, term, key=_term_start)
+
     def get_current_term(self, check_date: Optional[datetime] = None) -> Optional[GoalTerm]:
         """Return the active term, if any."""
-        for term in self.terms:
-            if term.is_active(check_date):
-                return term
+        check = check_date or current_time()
+        # Last term starting on or before check is the only candidate
+        i = bisect_right(self.terms, check, key=_term_start) - 1
+        if i >= 0 and self.terms[i].is_active(check):
+            return self.terms[i]
         return None
 
 
@@ -151,24 +202,23 @@ class LifeTime(DerivedEntity):
     def __post_init__(self):
         """Calculate estimated death date if not provided"""
         if self.estimated_death_date is None:
-            days_to_live = int(MN_LIFE_EXPECTANCY_YEARS * DAYS_PER_YEAR)
-            self.estimated_death_date = self.birth_date + timedelta(days=days_to_live)
+            self.estimated_death_date = self.birth_date + LIFE_EXPECTANCY
 
     def weeks_lived(self, from_date: Optional[datetime] = None) -> int:
         """Calculate approximate weeks lived so far."""
-        check = from_date or datetime.now()
+        check = from_date or current_time()
         days = (check - self.birth_date).days
         return days // 7
 
     def weeks_remaining(self, from_date: Optional[datetime] = None) -> int:
         """Calculate approximate weeks remaining."""
-        check = from_date or datetime.now()
+        check = from_date or current_time()
         days = (self.estimated_death_date - check).days
         return max(0, days // 7)
 
     def percentage_lived(self, from_date: Optional[datetime] = None) -> float:
         """What fraction of your expected life have you lived? (0.0 to 1.0)"""
-        check = from_date or datetime.now()
+        check = from_date or current_time()
         total_days = (self.estimated_death_date - self.birth_date).days
         lived_days = (check - self.birth_date).days
         return min(1.0, lived_days / total_days)
@@ -1,29 +1,33 @@
 """
 Simple logging setup for the application.
 
+All module loggers share one set of handlers, created on first use, so the log
+files are opened once per process rather than once per module. Loggers only
+enqueue records; a QueueListener thread does the file and console writes, so
+logging from request handlers or matching loops never blocks on disk.
 """
 
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import List, Optional
 from config.settings import LOG_DIR, LOG_LEVEL
 
-# Create logger
-def get_logger(name: str) -> logging.Logger:
-    """
-    Get a logger for the given module.
+# Shared handlers, built lazily by _get_handlers()
+_handlers: Optional[List[logging.Handler]] = None
 
-    Usage in your modules:
-        from config.logging_setup import get_logger
-        logger = get_logger(__name__)
-        logger.error("Something went wrong!")
-        logger.warning("Be careful!")
-    """
-    logger = logging.getLogger(name)
 
-    # Only configure if not already configured
-    if logger.handlers:
-        return logger
+def _get_handlers() -> List[logging.Handler]:
+    """
+    Create the handlers once and reuse them for every logger.
 
-    logger.setLevel(LOG_LEVEL)
+    Returns the QueueHandler that loggers attach; the file and console handlers
+    run behind it on a QueueListener that is stopped (and flushed) at exit.
+    """
+    global _handlers
+    if _handlers is not None:
+        return _handlers
 
     # Format: timestamp - module name - level - message
     formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -33,27 +37,54 @@ def get_logger(name: str) -> logging.Logger:
     error_handler = logging.FileHandler(error_file)
     error_handler.setLevel(logging.ERROR)
     error_handler.setFormatter(formatter)
-    logger.addHandler(error_handler)
 
     # 2. File handler for warnings and above
     warning_file = LOG_DIR / 'warnings.log'
     warning_handler = logging.FileHandler(warning_file)
     warning_handler.setLevel(logging.WARNING)
     warning_handler.setFormatter(formatter)
-    logger.addHandler(warning_handler)
 
     info_file = LOG_DIR / 'info.log'
     info_handler = logging.FileHandler(info_file)
     info_handler.setLevel(logging.INFO)
     info_handler.setFormatter(formatter)
-    logger.addHandler(info_handler)
-
 
     # 3. Console handler (optional - shows in terminal)
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.WARNING)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
 
+    # 4. Hand records to a background thread; respect_handler_level keeps each
+    #    handler's own level filtering
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, error_handler, warning_handler, info_handler,
+                             console_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+    _handlers = [QueueHandler(log_queue)]
+    return _handlers
+
+
+# Create logger
+def get_logger(name: str) -> logging.Logger:
+    """
+    Get a logger for the given module.
+
+    Usage in your modules:
+        from config.logging_setup import get_logger
+        logger = get_logger(__name__)
+        logger.error("Something went wrong!")
+        logger.warning("Be careful!")
+    """
+    logger = logging.getLogger(name)
+
+    # Only configure if not already configured
+    if logger.handlers:
+        return logger
+
+    logger.setLevel(LOG_LEVEL)
+    for handler in _get_handlers():
+        logger.addHandler(handler)
 
-    return logger
\ No newline at end of file
+    return logger
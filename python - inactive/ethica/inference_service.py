@@ -47,22 +47,23 @@ Written by Claude Code on 2025-10-11
 """
 
 from datetime import datetime
+from itertools import chain
+from operator import attrgetter
 from typing import List, Optional, Tuple
 from dataclasses import dataclass
 
 from categoriae.actions import Action
 from categoriae.goals import Goal
-from categoriae.relationships import ActionGoalRelationship
 from ethica.progress_matching import (
+    ActionGoalMatch,
     infer_matches,
+    iter_matches,
+    infer_matches_parallel,
     filter_ambiguous_matches,
     create_manual_match,
     confirm_suggested_match
 )
 
-# Alias for clearer naming in this service
-ActionGoalMatch = ActionGoalRelationship
-
 
 @dataclass
 class InferenceSession:
@@ -139,21 +140,20 @@ class ActionGoalInferenceService:
             if self._goal_overlaps_period(g, start_date, target_date)
         ]
 
-        # Run inference
-        all_matches = infer_matches(
+        # Run inference. Very large periods (years of history) are matched
+        # across processes; smaller ones run in-process.
+        matches = infer_matches_parallel(
             actions=period_actions,
             goals=period_goals,
             require_period_match=True
         )
-
-        # Separate by confidence
         confident, ambiguous = filter_ambiguous_matches(
-            all_matches,
+            matches,
             confidence_threshold=confidence_threshold
         )
 
         # Find unmatched actions
-        matched_action_ids = {id(m.action) for m in all_matches}
+        matched_action_ids = {id(m.action) for m in chain(confident, ambiguous)}
         unmatched = [a for a in period_actions if id(a) not in matched_action_ids]
 
         return InferenceSession(
@@ -185,9 +185,10 @@ class ActionGoalInferenceService:
         if active_goals is None:
             # Fetch currently active goals
             all_goals = self.goal_service.get_all()
+            now = datetime.now()  # once, not per goal
             active_goals = [
                 g for g in all_goals
-                if hasattr(g, 'target_date') and g.target_date and g.target_date >= datetime.now()
+                if g.target_date and g.target_date >= now
             ]
 
         # Run inference for just this action
@@ -198,7 +199,7 @@ class ActionGoalInferenceService:
         )
 
         # Sort by confidence descending
-        matches.sort(key=lambda m: m.confidence, reverse=True)
+        matches.sort(key=attrgetter('confidence'), reverse=True)
 
         return matches
 
@@ -222,9 +223,9 @@ class ActionGoalInferenceService:
             List of matching actions
         """
         # Determine time window
-        if start_date is None and hasattr(goal, 'start_date'):
+        if start_date is None:
             start_date = goal.start_date
-        if target_date is None and hasattr(goal, 'target_date'):
+        if target_date is None:
             target_date = goal.target_date
 
         # Fetch relevant actions
@@ -272,17 +273,18 @@ class ActionGoalInferenceService:
 
         return match
 
-    def confirm_match(self, suggested_match: ActionGoalMatch) -> ActionGoalMatch:
+    def confirm_match(self, suggested_match: ActionGoalMatch, in_place: bool = False) -> ActionGoalMatch:
         """
         User confirms an auto-inferred match.
 
         Args:
             suggested_match: An auto-inferred match to confirm
+            in_place: If True, update suggested_match rather than copying it
 
         Returns:
-            New match with method='user_confirmed'
+            Match with method='user_confirmed'
         """
-        confirmed = confirm_suggested_match(suggested_match)
+        confirmed = confirm_suggested_match(suggested_match, in_place=in_place)
 
         # Optionally persist
         if self.progress_service:
@@ -334,7 +336,7 @@ class ActionGoalInferenceService:
             True if goal is active during any part of the period
         """
         # Loose goals (no dates) are always active
-        if not hasattr(goal, 'start_date') or not goal.start_date:
+        if not goal.start_date:
             return True
 
         # Check for overlap: goal.start <= period.end AND goal.target >= period.start
@@ -355,6 +357,5 @@ def quick_infer(actions: List[Action], goals: List[Goal]) -> List[ActionGoalMatc
     Returns:
         List of confident matches only (>= 0.7 confidence)
     """
-    all_matches = infer_matches(actions, goals)
-    confident, _ = filter_ambiguous_matches(all_matches, confidence_threshold=0.7)
-    return confident
+    # Filtering at the source skips building the ambiguous list
+    return list(iter_matches(actions, goals, min_confidence=0.7))
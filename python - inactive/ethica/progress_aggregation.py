@@ -23,13 +23,13 @@ derived metrics (GoalProgress). No database, no formatting, no display logic.
 Written by Claude Code on 2025-10-12
 """
 
-from typing import List, Optional
-from dataclasses import dataclass
+from typing import Iterable, Iterator, List, Optional
+from dataclasses import dataclass, field
 from categoriae.goals import Goal
 from categoriae.relationships import ActionGoalRelationship
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GoalProgress:
     """
     Aggregated progress metrics for a goal.
@@ -42,11 +42,24 @@ class GoalProgress:
         matches: List of action-goal relationships contributing to this goal
         total_progress: Sum of all contributions (e.g., 102.5 km)
         target: Goal's target value (e.g., 120.0 km)
+
+    Frozen and slotted, so it can be shared, used as a dict key or set
+    member, and the percentage is computed once in __post_init__. The hash
+    covers only the totals: SmartGoal and Milestone are unhashable, and
+    lists aren't hashable, so goal and matches are left out of it but still
+    take part in equality.
     """
-    goal: Goal
-    matches: List[ActionGoalRelationship]
+    goal: Goal = field(hash=False)
+    matches: List[ActionGoalRelationship] = field(hash=False)
     total_progress: float
     target: float
+    _percent: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Returns 0 if target is 0 to avoid division by zero.
+        # object.__setattr__ because the dataclass is frozen.
+        object.__setattr__(self, '_percent',
+                           0.0 if self.target <= 0 else (self.total_progress / self.target) * 100)
 
     @property
     def percent(self) -> float:
@@ -56,9 +69,7 @@ class GoalProgress:
         Returns 0 if target is 0 to avoid division by zero.
         Can exceed 100% if goal is surpassed.
         """
-        if self.target <= 0:
-            return 0.0
-        return (self.total_progress / self.target) * 100
+        return self._percent
 
     @property
     def remaining(self) -> float:
@@ -130,23 +141,25 @@ def aggregate_goal_progress(
         >>> if progress.is_complete:
         >>>     print("Goal complete!")
     """
-    # Sum all contributions, treating None as 0
+    # Sum all contributions, treating None as 0 (one attribute read per match)
     total_progress = sum(
-        match.contribution for match in matches
-        if match.contribution is not None
+        contribution for match in matches
+        if (contribution := match.contribution) is not None
     )
 
-    # Use goal's target, default to 0 if not set
-    target = goal.measurement_target if goal.measurement_target is not None else 0.0
-
     return GoalProgress(
         goal=goal,
         matches=matches,
         total_progress=total_progress,
-        target=target
+        target=_target(goal)
     )
 
 
+def _target(goal: Goal) -> float:
+    """Goal's target, defaulting to 0 if not set."""
+    return goal.measurement_target if goal.measurement_target is not None else 0.0
+
+
 def aggregate_all_goals(
     goals: List[Goal],
     all_matches: List[ActionGoalRelationship]
@@ -155,7 +168,8 @@ def aggregate_all_goals(
     Calculate progress for multiple goals at once.
 
     Convenience function for batch processing. More efficient than calling
-    aggregate_goal_progress() individually.
+    aggregate_goal_progress() individually; the eager form of
+    iter_goal_progress().
 
     Args:
         goals: List of goals to calculate progress for
@@ -169,20 +183,64 @@ def aggregate_all_goals(
         >>> complete_goals = [p for p in all_progress if p.is_complete]
         >>> print(f"{len(complete_goals)} of {len(all_progress)} goals complete")
     """
-    # Group matches by goal for efficient lookup
-    from collections import defaultdict
-    matches_by_goal = defaultdict(list)
-    for match in all_matches:
-        matches_by_goal[match.goal].append(match)
+    return list(iter_goal_progress(goals, all_matches))
 
-    # Calculate progress for each goal
-    progress_list = []
-    for goal in goals:
-        goal_matches = matches_by_goal.get(goal, [])
-        progress = aggregate_goal_progress(goal, goal_matches)
-        progress_list.append(progress)
 
-    return progress_list
+def iter_goal_progress(
+    goals: Iterable[Goal],
+    all_matches: Iterable[ActionGoalRelationship]
+) -> Iterator[GoalProgress]:
+    """
+    Lazily calculate progress for multiple goals, one GoalProgress at a time.
+
+    The matches are grouped in a single pass on the first next(), after which
+    each goal's progress is built only as the caller asks for it - so a view
+    can start rendering the first goal without materializing the rest.
+    all_matches may be a generator such as iter_matches().
+
+    Args:
+        goals: Goals to calculate progress for
+        all_matches: All action-goal matches (consumed once)
+
+    Yields:
+        GoalProgress objects, one per goal (same order as input)
+    """
+    goals = list(goals)
+
+    # One pass over the matches groups them by goal object and sums
+    # contributions together. Keying on id() keeps the per-match work to an
+    # int hash: Goal hashes by value over every field, and SmartGoal and
+    # Milestone (plain @dataclass subclasses) are not hashable at all
+    by_object = {}
+    for match in all_matches:
+        goal = match.goal
+        entry = by_object.get(id(goal))
+        if entry is None:
+            entry = by_object[id(goal)] = [goal, [], 0]
+        entry[1].append(match)
+        if (contribution := match.contribution) is not None:
+            entry[2] += contribution
+
+    # Matches bound to an equal copy of a requested goal rather than the
+    # object itself still count toward it, compared once per distinct copy
+    requested = {id(goal) for goal in goals}
+    strays = [entry for key, entry in by_object.items() if key not in requested]
+    for stray, stray_matches, stray_total in strays:
+        goal = next((goal for goal in goals if goal == stray), None)
+        if goal is not None:
+            entry = by_object.setdefault(id(goal), [goal, [], 0])
+            entry[1].extend(stray_matches)
+            entry[2] += stray_total
+
+    # Same metrics as aggregate_goal_progress(), one GoalProgress per goal
+    for goal in goals:
+        _, goal_matches, total_progress = by_object.get(id(goal)) or (goal, [], 0)
+        yield GoalProgress(
+            goal=goal,
+            matches=goal_matches,
+            total_progress=total_progress,
+            target=_target(goal)
+        )
 
 
 def get_progress_summary(all_progress: List[GoalProgress]) -> dict:
@@ -213,10 +271,18 @@ def get_progress_summary(all_progress: List[GoalProgress]) -> dict:
             'total_actions_matched': 0
         }
 
-    complete_count = sum(1 for p in all_progress if p.is_complete)
+    # Single pass accumulating every statistic
+    complete_count = 0
+    percent_total = 0.0
+    total_actions = 0
+    for p in all_progress:
+        if p.is_complete:
+            complete_count += 1
+        percent_total += p.percent
+        total_actions += len(p.matches)
+
     in_progress_count = len(all_progress) - complete_count
-    avg_percent = sum(p.percent for p in all_progress) / len(all_progress)
-    total_actions = sum(p.matching_actions_count for p in all_progress)
+    avg_percent = percent_total / len(all_progress)
 
     return {
         'total_goals': len(all_progress),
@@ -40,24 +40,74 @@ These are JUDGMENT CALLS based on domain knowledge, not mechanical operations.
 uses pure functions with no side effects, and can be fully tested without
 touching a database. If you can test it with in-memory objects, it's business logic.
 
+## Actionability Hint Format
+
+how_goal_is_actionable stays a JSON text column ({"units": [...], "keywords": [...]}).
+Users type it into the goal forms, the API returns it verbatim, and the Swift
+client reads the same database - so a binary encoding (msgpack etc.) isn't an
+option. Decode cost is handled here instead: each distinct hint string is
+parsed once per process (_parse_how_goal_is_actionable is lru_cached), using
+orjson when installed.
+
+Keywords are deliberately unweighted: any one of a goal's keywords in the
+title satisfies the keyword check. They are chosen per goal by the user rather
+than mined from free text, so a keyword shared by many goals ("run" on both a
+10k goal and a marathon goal) is a real signal for each of them. Weighting
+by how many goals use a keyword (IDF) would quietly drop those matches, so
+inferred confidence stays a fixed _INFERRED_CONFIDENCE and shared keywords are
+made cheap instead (one scan per distinct keyword set per action).
+
 Written by Claude Code on 2025-10-11
 Updated by Claude Code on 2025-10-11 - Refactored to use categoriae/relationships
 Updated by Claude Code on 2025-10-12 - Added how_goal_is_actionable-based matching
 """
 
 import json
-from datetime import datetime
-from typing import List, Optional, Tuple
-from categoriae.actions import Action
+import os
+import re
+import sys
+from collections import defaultdict
+from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import chain
+from typing import Callable, FrozenSet, Iterable, Iterator, List, Optional, Tuple
+from categoriae.actions import Action, to_ticks
 from categoriae.goals import Goal, SmartGoal
-from categoriae.relationships import ActionGoalRelationship
+from categoriae.relationships import ActionGoalRelationship, AssignmentMethod
 from config.logging_setup import get_logger
 
 # Alias for backwards compatibility and clearer naming in this module
 ActionGoalMatch = ActionGoalRelationship
 
+# Constants for the inference hot path (one ActionGoalMatch per match)
+_AUTO_INFERRED = AssignmentMethod.AUTO_INFERRED
+_INFERRED_CONFIDENCE = 0.9
+
 logger = get_logger(__name__)
 
+# orjson decodes the small actionability payloads several times faster than the
+# stdlib; it's optional, so fall back to json when it isn't installed. Text
+# orjson rejects but json accepts (NaN, integers wider than 64 bits) is retried
+# with json, so hints parse the same either way.
+try:
+    import orjson
+except ImportError:
+    _json_loads = json.loads
+else:
+    def _json_loads(text: str):
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            return json.loads(text)
+
+# pyahocorasick scans a title for every goal's keywords at once (reporting
+# overlapping hits, unlike a regex alternation). Also optional - without it each
+# distinct keyword set is scanned with its own compiled regex.
+try:
+    import ahocorasick as _ahocorasick
+except ImportError:
+    _ahocorasick = None
+
 
 def matches_on_period(action: Action, goal: Goal) -> bool:
     """
@@ -73,15 +123,52 @@ def matches_on_period(action: Action, goal: Goal) -> bool:
     if not action.log_time:
         return False  # Can't match without timestamp
 
+    period = goal_period(goal)
+    return period is None or period[0] <= action.log_time <= period[1]
+
+
+def goal_period(goal: Goal) -> Optional[Tuple[datetime, datetime]]:
+    """
+    The (start, target) window an action must fall in, or None if unconstrained.
+
+    Only dated SmartGoals constrain the period. Resolving this once per goal
+    keeps the isinstance() dispatch out of infer_matches()' inner loop.
+    """
     # Loose goals have no period - accept all actions
-    if not hasattr(goal, 'start_date') or not goal.start_date:
-        return True
+    # (start_date is a Goal field, so a plain read - no hasattr needed)
+    if goal.start_date is None:
+        return None
 
     # SmartGoal with dates
     if isinstance(goal, SmartGoal):
-        return goal.start_date <= action.log_time <= goal.target_date
+        return (goal.start_date, goal.target_date)
+
+    return None
+
+
+def _period_ticks(goal: Goal) -> Optional[Tuple[int, int]]:
+    """
+    goal_period() as integer ticks, comparable with to_ticks(action.log_time).
+
+    infer_matches() compares every candidate pair on these ints rather than on
+    datetimes; the conversion is paid once per goal.
+    """
+    period = goal_period(goal)
+    return None if period is None else (to_ticks(period[0]), to_ticks(period[1]))
+
 
-    return True
+# Ticks per week, for bucketing goal periods and action log times
+_WEEK_TICKS = timedelta(weeks=1) // timedelta(microseconds=1)
+
+
+def _period_weeks(period: Tuple[int, int]) -> range:
+    """
+    Week numbers (ticks // _WEEK_TICKS) touched by a _period_ticks() period.
+
+    Used to bucket dated goals so an action only visits goals running in the
+    week it was logged; the exact period check still runs on each candidate.
+    """
+    return range(period[0] // _WEEK_TICKS, period[1] // _WEEK_TICKS + 1)
 
 
 def matches_on_unit(action: Action, goal: Goal) -> Tuple[bool, Optional[str], Optional[float]]:
@@ -101,7 +188,7 @@ def matches_on_unit(action: Action, goal: Goal) -> Tuple[bool, Optional[str], Op
     if not action.measurement_units_by_amount or not goal.measurement_unit:
         return (False, None, None)
 
-    goal_unit = goal.measurement_unit.lower().replace(' ', '_')
+    goal_unit = _normalize_unit(goal.measurement_unit)
 
     # Look for measurement keys that contain the goal unit
     for measurement_key, value in action.measurement_units_by_amount.items():
@@ -111,6 +198,66 @@ def matches_on_unit(action: Action, goal: Goal) -> Tuple[bool, Optional[str], Op
     return (False, None, None)
 
 
+@lru_cache(maxsize=1024)
+def _normalize_unit(unit: str) -> str:
+    """Goal unit as matched against measurement keys ("Pages Read" -> "pages_read")."""
+    return sys.intern(unit.lower().replace(' ', '_'))
+
+
+# (allowed_units, required_keywords, keyword_search) - allowed_units is a set
+# for O(1) membership; keyword_search(title) is truthy when the casefolded title
+# contains any keyword, or None when there are no keywords
+_Hints = Tuple[FrozenSet[str], Tuple[str, ...], Optional[Callable[[str], object]]]
+
+
+def _keyword_search(keywords: Tuple[str, ...]) -> Callable[[str], object]:
+    """
+    Build the any-keyword substring test for a goal's keywords.
+
+    A single keyword is a plain 'in' test, which avoids the regex engine's
+    call overhead; from two keywords up one precompiled alternation scanning
+    the title once is faster than testing each keyword in turn.
+    """
+    if len(keywords) == 1:
+        keyword = keywords[0]
+        return lambda title: keyword in title
+    return re.compile('|'.join(map(re.escape, keywords))).search
+
+
+@lru_cache(maxsize=1024)
+def _parse_how_goal_is_actionable(raw: str) -> Optional[_Hints]:
+    """
+    Parse how_goal_is_actionable JSON into normalized (units, keywords, keyword_search).
+
+    Goals are mutable so match results can't be cached per goal, but the JSON
+    string is immutable: keying the cache on it means every action compared
+    against the same goal reuses one parse.
+
+    The keywords are also compiled into one test (see _keyword_search) so a
+    title is scanned once for all of them instead of once per keyword.
+
+    Returns:
+        Tuple of (allowed_units, required_keywords, keyword_search), lowercased
+        (keywords casefolded) with wildcards stripped, or None if the JSON is
+        malformed
+    """
+    try:
+        data = _json_loads(raw)
+        # Normalize to lowercase and strip wildcards. Keywords are casefolded to
+        # match _action_view() titles ("Straße" finds "STRASSE").
+        allowed_units = frozenset(sys.intern(u.lower().strip()) for u in data.get('units', []))
+        required_keywords = tuple(k.casefold().strip().replace('*', '').strip()
+                                  for k in data.get('keywords', []) if k.strip())
+    except (json.JSONDecodeError, AttributeError, TypeError) as e:
+        logger.warning(
+            f"Malformed how_goal_is_actionable JSON: {e}. "
+            f"Value was: {raw!r}. Falling back to simple unit matching."
+        )
+        return None
+    keyword_search = _keyword_search(required_keywords) if required_keywords else None
+    return (allowed_units, required_keywords, keyword_search)
+
+
 def matches_with_how_goal_is_actionable(action: Action, goal: Goal) -> Tuple[bool, Optional[float]]:
     """
     Check if action matches goal using structured how_goal_is_actionable hints.
@@ -142,26 +289,28 @@ def matches_with_how_goal_is_actionable(action: Action, goal: Goal) -> Tuple[boo
         Action: "Yoga class" with {"minutes": 30}
         → (False, None)  # Wrong keywords
     """
+    return _matches_with_compiled(_action_view(action), _compile_actionability(goal), _goal_unit(goal))
+
+
+def _compile_actionability(goal: Goal) -> Optional[_Hints]:
+    """
+    Resolve a goal's actionability hints once per matching pass.
+
+    Returns:
+        Normalized hints, or None when the goal has no usable hints (missing,
+        malformed or empty) and matching should fall back to matches_on_unit()
+    """
     # If no how_goal_is_actionable hints, fall back to simple unit matching
-    if not hasattr(goal, 'how_goal_is_actionable') or not goal.how_goal_is_actionable:
-        unit_match, _, contribution = matches_on_unit(action, goal)
-        return (unit_match, contribution)
+    if not goal.how_goal_is_actionable:
+        return None
 
-    # Parse JSON how_goal_is_actionable
-    try:
-        data = json.loads(goal.how_goal_is_actionable)
-        # Normalize to lowercase and strip wildcards
-        allowed_units = [u.lower().strip() for u in data.get('units', [])]
-        required_keywords = [k.lower().strip().replace('*', '').strip()
-                           for k in data.get('keywords', []) if k.strip()]
-    except (json.JSONDecodeError, AttributeError, TypeError) as e:
-        # Malformed JSON - log warning and fall back to unit matching
-        logger.warning(
-            f"Malformed how_goal_is_actionable JSON for goal '{goal.title[:50]}...': {e}. "
-            f"Value was: {goal.how_goal_is_actionable!r}. Falling back to simple unit matching."
-        )
-        unit_match, _, contribution = matches_on_unit(action, goal)
-        return (unit_match, contribution)
+    # Parse JSON how_goal_is_actionable (cached per distinct JSON string)
+    raw_hints = goal.how_goal_is_actionable
+    hints = _parse_how_goal_is_actionable(raw_hints) if isinstance(raw_hints, str) else None
+    if hints is None:
+        # Malformed JSON (warned in the parser) - fall back to unit matching
+        return None
+    allowed_units, required_keywords, _ = hints
 
     if not allowed_units or not required_keywords:
         # Empty how_goal_is_actionable hints - log and fall back to unit matching
@@ -170,17 +319,58 @@ def matches_with_how_goal_is_actionable(action: Action, goal: Goal) -> Tuple[boo
             f"Units: {allowed_units}, Keywords: {required_keywords}. "
             f"Falling back to simple unit matching."
         )
-        unit_match, _, contribution = matches_on_unit(action, goal)
-        return (unit_match, contribution)
+        return None
 
-    # Check 1: Does action have measurement matching allowed units?
-    if not action.measurement_units_by_amount:
+    return hints
+
+
+def _goal_unit(goal: Goal) -> str:
+    """Normalized goal unit for the matches_on_unit() fallback, or '' if unset."""
+    return _normalize_unit(goal.measurement_unit) if goal.measurement_unit else ''
+
+
+# (action, casefolded title, ((lowercased measurement key, value), ...))
+_ActionView = Tuple[Action, str, Tuple[Tuple[str, float], ...]]
+
+
+def _action_view(action: Action) -> _ActionView:
+    """Casefold an action's title and lowercase (and intern) its measurement keys once per matching pass."""
+    measurements = action.measurement_units_by_amount
+    return (
+        action,
+        action.title.casefold() if action.title else '',
+        tuple((sys.intern(key.lower()), value) for key, value in measurements.items()) if measurements else (),
+    )
+
+
+def _matches_with_compiled(
+    view: _ActionView,
+    hints: Optional[_Hints],
+    goal_unit: str,
+    keyword_hits: Optional[dict] = None
+) -> Tuple[bool, Optional[float]]:
+    """
+    Actionability check of an _action_view() against _compile_actionability() hints.
+
+    goal_unit is the goal's _goal_unit(), only consulted when hints is None.
+    keyword_hits, if given, memoizes keyword scans of this view by keyword test, so
+    goals sharing a keyword set cost one scan per action rather than one each.
+    """
+    _, action_lower, measurements_lower = view
+    if hints is None:
+        # Same rule as matches_on_unit(), on the pre-lowercased keys
+        if goal_unit:
+            for key_lower, value in measurements_lower:
+                if goal_unit in key_lower:
+                    return (True, value)
         return (False, None)
+    allowed_units, _, keyword_search = hints
 
-    # Check for exact unit match (case-insensitive)
+    # Check 1: Does action have measurement matching allowed units?
+    # Exact unit match (case-insensitive - keys were lowercased in the view)
     contribution = None
-    for key, value in action.measurement_units_by_amount.items():
-        if key.lower() in allowed_units:
+    for key_lower, value in measurements_lower:
+        if key_lower in allowed_units:
             contribution = value
             break
 
@@ -188,20 +378,60 @@ def matches_with_how_goal_is_actionable(action: Action, goal: Goal) -> Tuple[boo
         return (False, None)
 
     # Check 2: Does action description contain required keywords?
-    if not action.title:
+    if not action_lower:
         return (False, None)
 
-    # Check if any keyword appears in description (substring, case-insensitive)
-    action_lower = action.title.lower()
-    keyword_matched = any(kw in action_lower for kw in required_keywords)
-
-    if not keyword_matched:
+    # Check if any keyword appears in description (substring, case-insensitive),
+    # one scan for all keywords
+    if keyword_hits is None:
+        hit = bool(keyword_search(action_lower))
+    else:
+        hit = keyword_hits.get(keyword_search)
+        if hit is None:
+            hit = keyword_hits[keyword_search] = bool(keyword_search(action_lower))
+    if not hit:
         return (False, None)
 
     # Both checks passed!
     return (True, contribution)
 
 
+def _build_keyword_automaton(compiled_goals: list):
+    """
+    Build one Aho-Corasick automaton over the keywords of every hinted goal.
+
+    Each keyword maps to the indexes (into compiled_goals) of the goals that
+    list it, so one pass over a title yields every goal whose keyword check
+    passes.
+
+    Returns:
+        Tuple of (automaton, indexed_goal_ids), or None when pyahocorasick isn't
+        installed or no goal has keywords to index
+    """
+    if _ahocorasick is None:
+        return None
+
+    goals_by_keyword = defaultdict(list)
+    indexed_goal_ids = set()
+    for i, (_, hints, _, _) in enumerate(compiled_goals):
+        # A keyword that stripped down to '' (e.g. "*") matches any title;
+        # leave such goals to the regex path
+        if hints is None or '' in hints[1]:
+            continue
+        indexed_goal_ids.add(i)
+        for keyword in set(hints[1]):
+            goals_by_keyword[keyword].append(i)
+
+    if not goals_by_keyword:
+        return None
+
+    automaton = _ahocorasick.Automaton()
+    for keyword, goal_ids in goals_by_keyword.items():
+        automaton.add_word(keyword, tuple(goal_ids))
+    automaton.make_automaton()
+    return (automaton, frozenset(indexed_goal_ids))
+
+
 def infer_matches(
     actions: List[Action],
     goals: List[Goal],
@@ -210,65 +440,257 @@ def infer_matches(
     """
     Automatically infer which actions contribute to which goals.
 
+    List-returning wrapper around iter_matches() for callers that need len(),
+    sorting, or more than one pass over the results.
+
+    Args:
+        actions: List of actions to match
+        goals: List of active goals
+        require_period_match: If True, only match actions within goal period
+
+    Returns:
+        List of ActionGoalMatch objects with auto-inferred relationships
+    """
+    return list(iter_matches(actions, goals, require_period_match))
+
+
+# A match plan is a compact, picklable form of a match list:
+# ((action index, goal index, contribution), ...)
+_MatchPlan = Tuple[Tuple[int, int, Optional[float]], ...]
+
+
+def _plan_from_matches(
+    actions: List[Action],
+    goals: List[Goal],
+    matches: Iterable[ActionGoalMatch],
+    offset: int = 0
+) -> _MatchPlan:
+    """Reduce matches to index rows; offset is added to each action index."""
+    action_index = {id(action): i + offset for i, action in enumerate(actions)}
+    goal_index = {id(goal): i for i, goal in enumerate(goals)}
+    return tuple((action_index[id(m.action)], goal_index[id(m.goal)], m.contribution) for m in matches)
+
+
+def _matches_from_plan(actions: List[Action], goals: List[Goal], plan: _MatchPlan) -> List[ActionGoalMatch]:
+    """Build fresh auto-inferred matches for a plan against these actions and goals."""
+    return [
+        ActionGoalMatch(actions[a], goals[g], contribution, _AUTO_INFERRED, _INFERRED_CONFIDENCE)
+        for a, g, contribution in plan
+    ]
+
+
+def iter_matches(
+    actions: Iterable[Action],
+    goals: List[Goal],
+    require_period_match: bool = True,
+    min_confidence: float = 0.0
+) -> Iterator[ActionGoalMatch]:
+    """
+    Lazily infer which actions contribute to which goals.
+
     Matching strategy (all criteria must pass):
     1. Period: Action during goal timeframe (if goal has dates)
     2. Actionability: Action has correct unit AND description contains required keywords
 
     Uses structured how_goal_is_actionable JSON to prevent false positives.
+    Goals are bucketed by allowed unit (and, when periods are enforced, by the
+    weeks their period spans), so each action is only compared with goals
+    that accept one of its measurement units and are running that week. When
+    pyahocorasick is installed, goals whose keywords don't occur in the title
+    are dropped too.
 
     Args:
         actions: List of actions to match
         goals: List of active goals
         require_period_match: If True, only match actions within goal period
+        min_confidence: Only yield matches at or above this confidence
 
-    Returns:
-        List of ActionGoalMatch objects with auto-inferred relationships
+    Yields:
+        ActionGoalMatch objects with auto-inferred relationships, in action
+        order and then goal order
     """
-    matches = []
+    # Resolve each goal's actionability hints once, not once per action
+    compiled_goals = [
+        (goal, _compile_actionability(goal), _period_ticks(goal), _goal_unit(goal))
+        for goal in goals
+    ]
+
+    # Index goals by (allowed unit, week) so each action only visits goals it
+    # could satisfy. The week is None for goals without a period, or for every
+    # goal when periods aren't enforced. Goals without usable hints fall back to
+    # substring unit matching, which can't be keyed by unit - they are bucketed
+    # by week only (unless they have no unit at all and can never match).
+    goals_by_unit = defaultdict(list)
+    unindexed_goals = defaultdict(list)
+    # Span covered by the indexed goals' periods; stays None if any indexed
+    # goal accepts actions from any time
+    window = None
+    unbounded = False
+    for i, (_, hints, period, goal_unit) in enumerate(compiled_goals):
+        if hints is None and not goal_unit:
+            continue
+        if require_period_match and period is not None:
+            weeks = _period_weeks(period)
+            window = period if window is None else (min(window[0], period[0]), max(window[1], period[1]))
+        else:
+            weeks = (None,)
+            unbounded = True
+        for week in weeks:
+            if hints is None:
+                unindexed_goals[week].append(i)
+            else:
+                for unit in hints[0]:
+                    goals_by_unit[unit, week].append(i)
+
+    if unbounded:
+        window = None  # Some goal accepts any time - no span to prune by
+    elif window is None:
+        return  # No goal can match anything
+
+    keyword_index = _build_keyword_automaton(compiled_goals)
+    # Goals any action may reach regardless of its week; the unit buckets
+    # keyed by week None are only probed when some goal landed in one
+    always_candidates = unindexed_goals.get(None, ())
+    probe_unbounded_units = any(week is None for _, week in goals_by_unit)
 
     for action in actions:
-        for goal in goals:
-            # Criterion 1: Period match
-            period_match = matches_on_period(action, goal)
-            if require_period_match and not period_match:
+        if require_period_match:
+            log_time = action.log_time
+            if not log_time:
+                continue  # Can't match a period without a timestamp
+            # Converted once per action; periods and weeks compare on ticks
+            log_ticks = to_ticks(log_time)
+            if window is not None and not (window[0] <= log_ticks <= window[1]):
+                continue  # Outside every goal's period - skip before any string work
+        # Lowercase the action's strings once, not once per goal
+        view = _action_view(action)
+        if not view[2]:
+            continue  # No measurements - neither matching path can succeed
+
+        candidate_ids = set(always_candidates)
+        if probe_unbounded_units:
+            for key_lower, _ in view[2]:
+                candidate_ids.update(goals_by_unit.get((key_lower, None), ()))
+        if require_period_match:
+            week = log_ticks // _WEEK_TICKS
+            candidate_ids.update(unindexed_goals.get(week, ()))
+            for key_lower, _ in view[2]:
+                candidate_ids.update(goals_by_unit.get((key_lower, week), ()))
+        if not candidate_ids:
+            continue  # No goal shares a unit and week with this action
+        keyword_hits = {}
+        if keyword_index is not None:
+            # One automaton pass settles the keyword check for every indexed goal
+            automaton, indexed_goal_ids = keyword_index
+            hit_ids = {i for _, goal_ids in automaton.iter(view[1]) for i in goal_ids}
+            candidate_ids = {i for i in candidate_ids if i in hit_ids or i not in indexed_goal_ids}
+            keyword_hits = {compiled_goals[i][1][2]: True for i in candidate_ids & hit_ids}
+
+        # Sorted so matches keep the input goal order
+        for i in sorted(candidate_ids):
+            goal, hints, period, goal_unit = compiled_goals[i]
+            # Criterion 1: Period match (same rule as matches_on_period)
+            if require_period_match and period is not None and not (period[0] <= log_ticks <= period[1]):
                 continue
 
             # Criterion 2: Actionability match (unit + keywords)
-            how_goal_is_actionable_match, contribution = matches_with_how_goal_is_actionable(action, goal)
+            how_goal_is_actionable_match, contribution = _matches_with_compiled(view, hints, goal_unit, keyword_hits)
             if not how_goal_is_actionable_match:
                 continue
 
             # High confidence for period + how_goal_is_actionable match
-            # Actionability already validates both unit and keyword requirements
-            confidence = 0.9
+            # Actionability already validates both unit and keyword requirements.
+            # Positional args in field order (action, goal, contribution,
+            # assignment_method, confidence) - this runs once per match.
+            match = ActionGoalMatch(action, goal, contribution, _AUTO_INFERRED, _INFERRED_CONFIDENCE)
+            if match.confidence >= min_confidence:
+                yield match
+
+
+# Below this many actions, process start-up and pickling outweigh the speedup
+PARALLEL_MIN_ACTIONS = 10_000
+# Default worker ceiling: past this, each extra process costs more to start
+# and feed than its shard of the matching saves
+PARALLEL_MAX_WORKERS = 8
+
+
+def _infer_shard(shard: Tuple[List[Action], List[Goal], bool, int]) -> _MatchPlan:
+    """Worker for infer_matches_parallel(): match one shard of actions."""
+    actions, goals, require_period_match, offset = shard
+    return _plan_from_matches(actions, goals, iter_matches(actions, goals, require_period_match), offset)
+
+
+def infer_matches_parallel(
+    actions: List[Action],
+    goals: List[Goal],
+    require_period_match: bool = True,
+    max_workers: Optional[int] = None,
+    min_actions: int = PARALLEL_MIN_ACTIONS
+) -> List[ActionGoalMatch]:
+    """
+    infer_matches() spread across worker processes for very large action lists.
 
-            matches.append(ActionGoalMatch(
-                action=action,
-                goal=goal,
-                contribution=contribution,
-                assignment_method='auto_inferred',
-                confidence=confidence
-            ))
+    Matching is independent per action, so actions are split into one
+    contiguous shard per worker and each shard is matched against all goals.
+    Workers see pickled copies, so they return match plans (index rows) and
+    the matches are rebuilt here against the caller's own objects. Results are
+    in the same order infer_matches() would give.
 
-    return matches
+    Args:
+        actions: List of actions to match
+        goals: List of active goals
+        require_period_match: If True, only match actions within goal period
+        max_workers: Worker processes (defaults to the CPU count, capped at
+                     PARALLEL_MAX_WORKERS)
+        min_actions: Below this many actions, match in-process instead
+
+    Returns:
+        List of ActionGoalMatch objects with auto-inferred relationships
+    """
+    workers = max_workers or min(os.cpu_count() or 1, PARALLEL_MAX_WORKERS)
+    if len(actions) < min_actions or workers < 2:
+        return infer_matches(actions, goals, require_period_match)
+
+    # Imported here: concurrent.futures.process pulls in multiprocessing, which
+    # most callers (small action lists, the web app) never need
+    from concurrent.futures import ProcessPoolExecutor
+
+    size = -(-len(actions) // workers)  # ceil division
+    shards = [
+        (actions[start:start + size], goals, require_period_match, start)
+        for start in range(0, len(actions), size)
+    ]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        plan = tuple(chain.from_iterable(executor.map(_infer_shard, shards)))
+    return _matches_from_plan(actions, goals, plan)
 
 
 def filter_ambiguous_matches(
-    matches: List[ActionGoalMatch],
+    matches: Iterable[ActionGoalMatch],
     confidence_threshold: float = 0.7
 ) -> Tuple[List[ActionGoalMatch], List[ActionGoalMatch]]:
     """
     Separate high-confidence matches from ambiguous ones needing user confirmation.
 
+    Partitions in a single pass, so matches may be a generator such as
+    iter_matches().
+
     Args:
-        matches: List of all inferred matches
+        matches: All inferred matches (list or iterator)
         confidence_threshold: Confidence level above which matches are accepted
 
     Returns:
         Tuple of (confident_matches, ambiguous_matches)
     """
-    confident = [m for m in matches if m.confidence >= confidence_threshold]
-    ambiguous = [m for m in matches if m.confidence < confidence_threshold]
+    confident = []
+    ambiguous = []
+    # Bound appends keep the attribute lookups out of the loop
+    accept, defer = confident.append, ambiguous.append
+    for m in matches:
+        if m.confidence >= confidence_threshold:
+            accept(m)
+        else:
+            defer(m)
 
     return confident, ambiguous
 
@@ -299,25 +721,35 @@ def create_manual_match(
         action=action,
         goal=goal,
         contribution=contribution,
-        assignment_method='manual',
+        assignment_method=AssignmentMethod.MANUAL,
         confidence=1.0
     )
 
 
-def confirm_suggested_match(match: ActionGoalMatch) -> ActionGoalMatch:
+def confirm_suggested_match(match: ActionGoalMatch, *, in_place: bool = False) -> ActionGoalMatch:
     """
     Convert an auto-inferred match to user-confirmed.
 
+    By default this returns a new match and leaves the suggestion untouched.
+    Callers that own the suggestion (e.g. confirming items straight out of an
+    InferenceSession) can pass in_place=True to skip the copy.
+
     Args:
         match: Auto-inferred match to confirm
+        in_place: If True, update and return match itself instead of a copy
 
     Returns:
-        New ActionGoalMatch with method='user_confirmed' and confidence=1.0
+        ActionGoalMatch with method='user_confirmed' and confidence=1.0
     """
+    if in_place:
+        match.assignment_method = AssignmentMethod.USER_CONFIRMED
+        match.confidence = 1.0
+        return match
+
     return ActionGoalMatch(
         action=match.action,
         goal=match.goal,
         contribution=match.contribution,
-        assignment_method='user_confirmed',
+        assignment_method=AssignmentMethod.USER_CONFIRMED,
         confidence=1.0
     )
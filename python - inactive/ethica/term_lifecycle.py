@@ -26,15 +26,30 @@ Written by Claude Code on 2025-10-13
 Updated by Claude Code on 2025-10-14 (added presentation helper functions)
 """
 
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import List, Optional, Tuple
-from categoriae.terms import GoalTerm
+from categoriae.terms import GoalTerm, TEN_WEEKS, current_time
 from categoriae.goals import Goal
 from categoriae.actions import Action
 from config.logging_setup import get_logger
 
 logger = get_logger(__name__)
 
+# One unit of each calculate_target_date_from_duration() unit, in error-message
+# order. Months are approximated as 30 days.
+_DURATION_UNITS = {
+    'days': timedelta(days=1),
+    'weeks': timedelta(weeks=1),
+    'months': timedelta(days=30),
+    'hours': timedelta(hours=1),
+    'minutes': timedelta(minutes=1),
+}
+
+# _classify_term() lookup, indexed by (check < start) << 1 | (check > target).
+# "Not started" wins over "ended" so a term with inverted dates reads as upcoming.
+_TERM_STATUS = ('active', 'complete', 'upcoming', 'upcoming')
+
 
 def get_active_term(
     terms: List[GoalTerm],
@@ -43,6 +58,9 @@ def get_active_term(
     """
     Find the term that is active on a given date.
 
+    A single early-exit scan: terms arrive in storage order, so sorting them
+    for a bisect would cost more than one pass.
+
     Args:
         terms: List of all terms to search
         check_date: Date to check (defaults to today)
@@ -50,10 +68,12 @@ def get_active_term(
     Returns:
         Active term if found, None otherwise
     """
-    check = check_date or datetime.now()
+    check = check_date or current_time()
 
+    # Same window as GoalTerm.is_active(), inlined to skip a method call and
+    # its check_date defaulting per term
     for term in terms:
-        if term.is_active(check):
+        if term.start_date <= check <= term.target_date:
             return term
 
     return None
@@ -73,14 +93,10 @@ def get_committed_goals(term: GoalTerm, all_goals: List[Goal]) -> List[Goal]:
     Returns:
         List of goals explicitly assigned to this term
     """
-    committed = []
-
-    for goal in all_goals:
-        # Explicit assignment (goal ID in term.term_goals_by_id list)
-        if hasattr(goal, 'id') and goal.id in term.term_goals_by_id:
-            committed.append(goal)
-
-    return committed
+    # Explicit assignment (goal ID in term.term_goals_by_id list) - a set built
+    # once per call makes each membership test O(1) instead of a scan of the list
+    committed_ids = frozenset(term.term_goals_by_id)
+    return [goal for goal in all_goals if goal.id in committed_ids]
 
 
 def get_overlapping_goals(term: GoalTerm, all_goals: List[Goal]) -> List[Goal]:
@@ -96,26 +112,17 @@ def get_overlapping_goals(term: GoalTerm, all_goals: List[Goal]) -> List[Goal]:
     Returns:
         List of goals with date overlap (excluding already-committed goals)
     """
-    committed_ids = set(term.term_goals_by_id)
-    overlapping = []
-
-    for goal in all_goals:
-        # Skip if already committed
-        if hasattr(goal, 'id') and goal.id in committed_ids:
-            continue
-
-        # Check date range overlap (for SmartGoals with dates)
-        if hasattr(goal, 'start_date') and hasattr(goal, 'target_date'):
-            if goal.start_date and goal.target_date:
-                # Date ranges overlap if one starts before the other ends
-                overlaps = (
-                    goal.start_date <= term.target_date and
-                    goal.target_date >= term.start_date
-                )
-                if overlaps:
-                    overlapping.append(goal)
+    committed_ids = frozenset(term.term_goals_by_id)
+    term_start, term_end = term.start_date, term.target_date
 
-    return overlapping
+    # Skip already-committed goals and goals without dates; date ranges overlap
+    # if one starts before the other ends
+    return [
+        goal for goal in all_goals
+        if goal.id not in committed_ids
+        and goal.start_date is not None and goal.target_date is not None
+        and goal.start_date <= term_end and goal.target_date >= term_start
+    ]
 
 
 def get_all_term_goals(term: GoalTerm, all_goals: List[Goal]) -> dict:
@@ -135,9 +142,21 @@ def get_all_term_goals(term: GoalTerm, all_goals: List[Goal]) -> dict:
     Returns:
         Dict with keys 'committed' and 'overlapping', each containing List[Goal]
     """
+    # One pass splits committed goals from the rest; only the rest need the
+    # date-overlap test (same rules as get_committed/get_overlapping_goals)
+    committed_ids = frozenset(term.term_goals_by_id)
+    term_start, term_end = term.start_date, term.target_date
+    committed, overlapping = [], []
+    for goal in all_goals:
+        if goal.id in committed_ids:
+            committed.append(goal)
+        elif (goal.start_date is not None and goal.target_date is not None
+              and goal.start_date <= term_end and goal.target_date >= term_start):
+            overlapping.append(goal)
+
     return {
-        'committed': get_committed_goals(term, all_goals),
-        'overlapping': get_overlapping_goals(term, all_goals)
+        'committed': committed,
+        'overlapping': overlapping
     }
 
 
@@ -155,15 +174,12 @@ def get_actions_in_term(
     Returns:
         List of actions with log_time within term boundaries
     """
-    matched_actions = []
-
-    for action in all_actions:
-        if action.log_time:
-            # Action occurred during term
-            if term.start_date <= action.log_time <= term.target_date:
-                matched_actions.append(action)
-
-    return matched_actions
+    # Term bounds read once; actions without a log_time are skipped
+    start, end = term.start_date, term.target_date
+    return [
+        action for action in all_actions
+        if action.log_time and start <= action.log_time <= end
+    ]
 
 
 def is_term_complete(term: GoalTerm, check_date: Optional[datetime] = None) -> bool:
@@ -177,7 +193,7 @@ def is_term_complete(term: GoalTerm, check_date: Optional[datetime] = None) -> b
     Returns:
         True if term's target_date has passed
     """
-    check = check_date or datetime.now()
+    check = check_date or current_time()
     return check > term.target_date
 
 
@@ -192,7 +208,7 @@ def is_term_upcoming(term: GoalTerm, check_date: Optional[datetime] = None) -> b
     Returns:
         True if term's start_date is in the future
     """
-    check = check_date or datetime.now()
+    check = check_date or current_time()
     return check < term.start_date
 
 
@@ -207,12 +223,19 @@ def get_term_status(term: GoalTerm, check_date: Optional[datetime] = None) -> st
     Returns:
         One of: 'upcoming', 'active', 'complete'
     """
-    if is_term_upcoming(term, check_date):
-        return 'upcoming'
-    elif term.is_active(check_date):
-        return 'active'
-    else:
-        return 'complete'
+    return _classify_term(term, check_date or current_time())[0]
+
+
+def _classify_term(term: GoalTerm, check: datetime) -> Tuple[str, bool]:
+    """
+    Classify a term against an already-resolved check time.
+
+    Returns (status, is_active) from one comparison against each bound, so
+    callers that also need term.is_active() don't repeat the comparisons.
+    """
+    # Two comparisons index the status table: bit 1 = not started, bit 0 = ended
+    status = _TERM_STATUS[((check < term.start_date) << 1) | (check > term.target_date)]
+    return status, status == 'active'
 
 
 def calculate_term_progress(
@@ -241,7 +264,7 @@ def calculate_term_progress(
         - total_goals: int
         - status: str ('upcoming', 'active', 'complete')
     """
-    check = check_date or datetime.now()
+    check = check_date or current_time()
 
     return {
         'term_number': term.term_number,
@@ -289,9 +312,11 @@ def get_terms_by_status(
     Returns:
         List of terms with matching status
     """
+    # Resolve "now" once so every term is classified against the same instant
+    check = check_date or current_time()
     return [
         term for term in terms
-        if get_term_status(term, check_date) == status
+        if _classify_term(term, check)[0] == status
     ]
 
 
@@ -313,17 +338,10 @@ def get_unassigned_goals(all_goals: List[Goal], all_terms: List[GoalTerm]) -> Li
         List of goals not assigned to any term
     """
     # Collect all goal IDs that are assigned to any term
-    assigned_ids = set()
-    for term in all_terms:
-        assigned_ids.update(term.term_goals_by_id)
+    assigned_ids = set().union(*(term.term_goals_by_id for term in all_terms))
 
     # Return goals whose IDs are not in the assigned set
-    unassigned = []
-    for goal in all_goals:
-        if hasattr(goal, 'id') and goal.id not in assigned_ids:
-            unassigned.append(goal)
-
-    return unassigned
+    return [goal for goal in all_goals if goal.id not in assigned_ids]
 
 
 def validate_goal_term_assignment(
@@ -347,25 +365,24 @@ def validate_goal_term_assignment(
         - warning_message: None if valid, explanation if questionable
     """
     # If goal has no dates, assignment is always valid
-    if (not hasattr(goal, 'start_date') or not goal.start_date ) or (not hasattr(goal, 'target_date') or not goal.target_date):
+    # (start_date/target_date are Goal fields defaulting to None - no hasattr needed)
+    goal_start, goal_target = goal.start_date, goal.target_date
+    if goal_start is None or goal_target is None:
         return (True, None)
+    term_start, term_end = term.start_date, term.target_date
 
-    # Check if goal dates overlap with term dates
-    overlaps = (
-        goal.start_date <= term.target_date and
-        goal.target_date >= term.start_date
-    )
-
-    if not overlaps:
+    # Check if goal dates overlap with term dates. Compared as datetimes, not
+    # day ordinals: a goal starting later on a term's last day is outside it.
+    if goal_start > term_end or goal_target < term_start:
         return (
             False,
-            f"Goal dates ({goal.start_date} to {goal.target_date}) don't overlap "
-            f"with term dates ({term.start_date} to {term.target_date})"
+            f"Goal dates ({goal_start} to {goal_target}) don't overlap "
+            f"with term dates ({term_start} to {term_end})"
         )
 
     # Warn if goal extends significantly beyond term
-    goal_duration = (goal.target_date - goal.start_date).days
-    term_duration = (term.target_date - term.start_date).days
+    goal_duration = (goal_target - goal_start).days
+    term_duration = (term_end - term_start).days
 
     if goal_duration > term_duration * 1.5:  # Goal is 50% longer than term
         return (
@@ -396,10 +413,7 @@ def calculate_next_term_number(terms: List[GoalTerm]) -> int:
     Returns:
         Next term number (1 if no terms exist)
     """
-    if not terms:
-        return 1
-
-    return max([t.term_number for t in terms]) + 1
+    return max((t.term_number for t in terms), default=0) + 1
 
 
 def get_default_term_dates() -> Tuple[datetime, datetime]:
@@ -412,8 +426,8 @@ def get_default_term_dates() -> Tuple[datetime, datetime]:
     Returns:
         Tuple of (start_date, target_date) as datetime objects
     """
-    start = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-    end = start + timedelta(days=GoalTerm.TEN_WEEKS_IN_DAYS)
+    start = current_time().replace(hour=0, minute=0, second=0, microsecond=0)
+    end = start + TEN_WEEKS
     return start, end
 
 
@@ -443,27 +457,40 @@ def calculate_target_date_from_duration(
     Raises:
         ValueError: If duration_unit is not recognized
     """
-    if duration_unit == 'days':
-        return start_date + timedelta(days=duration_value)
-    elif duration_unit == 'weeks':
-        return start_date + timedelta(weeks=duration_value)
-    elif duration_unit == 'months':
-        # Approximate: 30 days per month
-        return start_date + timedelta(days=duration_value * 30)
-    elif duration_unit == 'hours':
-        return start_date + timedelta(hours=duration_value)
-    elif duration_unit == 'minutes':
-        return start_date + timedelta(minutes=duration_value)
-    else:
+    step = _DURATION_UNITS.get(duration_unit)
+    if step is None:
         raise ValueError(f"Invalid duration_unit: {duration_unit}. "
-                        f"Must be one of: days, weeks, months, hours, minutes")
+                        f"Must be one of: {', '.join(_DURATION_UNITS)}")
+    return start_date + step * duration_value
+
+
+@dataclass(frozen=True, slots=True)
+class TermListRow:
+    """
+    One row of the terms list view, as built by prepare_terms_list_view().
+
+    Attributes:
+        term: The term being displayed
+        status: 'upcoming', 'active', or 'complete'
+        committed_goal_count: Committed goals that still exist
+        days_remaining: Days left (active terms only, else None)
+        progress_percent: Time elapsed on a 0-100 scale (active terms only, else None)
+
+    Slotted, so a dashboard of many terms holds fixed-layout rows rather
+    than one dict per term.
+    """
+    term: GoalTerm
+    status: str
+    committed_goal_count: int
+    days_remaining: Optional[int]
+    progress_percent: Optional[float]
 
 
 def prepare_terms_list_view(
     all_terms: List[GoalTerm],
     all_goals: List[Goal],
     check_date: Optional[datetime] = None
-) -> List[dict]:
+) -> List[TermListRow]:
     """
     Prepare enriched term data for list view presentation.
 
@@ -478,34 +505,34 @@ def prepare_terms_list_view(
         check_date: Datetime to calculate status from (defaults to now)
 
     Returns:
-        List of enriched term dicts, sorted appropriately for display.
-        Each dict contains:
-        - term: GoalTerm object
-        - status: str ('upcoming', 'active', 'complete')
-        - committed_goal_count: int
-        - days_remaining: int or None
-        - progress_percent: float or None (0-100 scale)
+        List of TermListRow, sorted appropriately for display
     """
-    check = check_date or datetime.now()
+    check = check_date or current_time()
+
+    goal_ids = {goal.id for goal in all_goals}
 
-    # Enrich terms with display data
+    # Enrich terms with display data in one pass per term: classify once, and
+    # only active terms pay for the day arithmetic
     terms_with_status = []
+    append = terms_with_status.append
     for term in all_terms:
-        committed = get_committed_goals(term, all_goals)
-        status = get_term_status(term, check)
-
-        terms_with_status.append({
-            'term': term,
-            'status': status,
-            'committed_goal_count': len(committed),
-            'days_remaining': term.days_remaining(check) if term.is_active(check) else None,
-            'progress_percent': term.progress_percentage(check) * 100 if term.is_active(check) else None
-        })
-
-    # Sort: active first, then by term number (descending)
-    terms_with_status.sort(key=lambda x: (
-        x['status'] != 'active',  # Active terms sort to top (False < True)
-        -x['term'].term_number    # Then reverse chronological
-    ))
+        status, active = _classify_term(term, check)
+        if active:
+            days_remaining = term.days_remaining(check)
+            progress_percent = term.progress_percentage(check) * 100
+        else:
+            days_remaining = progress_percent = None
+
+        append(TermListRow(
+            term=term,
+            status=status,
+            # Count only; no need to build the committed goal list
+            committed_goal_count=len(goal_ids.intersection(term.term_goals_by_id)),
+            days_remaining=days_remaining,
+            progress_percent=progress_percent,
+        ))
+
+    # Active terms first, then by term number descending
+    terms_with_status.sort(key=lambda r: (r.status != 'active', -r.term.term_number))
 
     return terms_with_status
@@ -5,31 +5,53 @@ JSON endpoints for programmatic access to goals, actions, values, and progress.
 
 Written by Claude Code on 2025-10-14.
 """
+import re
+from operator import itemgetter
+
 from flask import Blueprint, render_template, current_app
 
 # Create API blueprint
 api_bp = Blueprint('api', __name__)
 
+# URL parameters in a rule (e.g., <id>, <int:goal_id>)
+_ROUTE_PARAM_RE = re.compile(r'<(?:\w+:)?(\w+)>')
+_HIDDEN_METHODS = frozenset({'HEAD', 'OPTIONS'})
+# app.extensions key holding the app's route table
+_ROUTE_TABLE_KEY = 'api_route_table'
 
-# API Documentation route
-@api_bp.route('/')
-def index():
-    """API documentation - display all available routes."""
-    import re
+
+def _route_table(app) -> tuple:
+    """
+    Rows for the API documentation page.
+
+    index() stores the result on app.extensions, so it is built once per app
+    and goes away with it. Flask refuses new routes once an app has served
+    its first request, so the url_map this reads is fixed by then.
+    """
     routes = []
-    for rule in current_app.url_map.iter_rules():
+    for rule in app.url_map.iter_rules():
         if rule.endpoint != 'static':
             methods = rule.methods or set()
             # Extract parameters from URL (e.g., <id>, <int:goal_id>)
-            params = re.findall(r'<(?:\w+:)?(\w+)>', rule.rule)
+            params = _ROUTE_PARAM_RE.findall(rule.rule)
             routes.append({
                 'endpoint': rule.endpoint,
                 'url': rule.rule,
-                'methods': sorted([m for m in methods if m not in ['HEAD', 'OPTIONS']]),
+                'methods': sorted(methods - _HIDDEN_METHODS),
                 'params': params
             })
     # Sort by endpoint name for readability
-    routes.sort(key=lambda x: x['endpoint'])
+    routes.sort(key=itemgetter('endpoint'))
+    return tuple(routes)
+
+
+# API Documentation route
+@api_bp.route('/')
+def index():
+    """API documentation - display all available routes."""
+    routes = current_app.extensions.get(_ROUTE_TABLE_KEY)
+    if routes is None:
+        routes = current_app.extensions[_ROUTE_TABLE_KEY] = _route_table(current_app)
     return render_template('api.html', routes=routes)
 
 
@@ -13,8 +13,7 @@ from datetime import datetime
 from . import api_bp
 from rhetorica.storage_service import ActionStorageService, GoalStorageService
 from rhetorica.serializers import serialize, deserialize
-from ethica.progress_matching import infer_matches
-from categoriae.actions import Action
+from categoriae.actions import Action, naive_utc
 from config.logging_setup import get_logger
 
 logger = get_logger(__name__)
@@ -49,27 +48,33 @@ def get_actions():
         start_date_str = request.args.get('start_date')
         target_date_str = request.args.get('target_date')
 
-        if has_measurements:
-            actions = [a for a in actions if a.measurement_units_by_amount is not None]
-
-        if has_duration:
-            actions = [a for a in actions if a.duration_minutes is not None]
-
-        # Date range filtering
+        # Date range bounds parsed once per request; aware ones are normalized
+        # to naive UTC so they compare with the stored log times
+        start_date = target_date = None
         if start_date_str:
             try:
-                start_date = datetime.fromisoformat(start_date_str)
-                actions = [a for a in actions if a.log_time and a.log_time >= start_date]
+                start_date = naive_utc(datetime.fromisoformat(start_date_str))
             except ValueError:
                 return jsonify({'error': f'Invalid start_date format: {start_date_str}. Use ISO format.'}), 400
 
         if target_date_str:
             try:
-                target_date = datetime.fromisoformat(target_date_str)
-                actions = [a for a in actions if a.log_time and a.log_time <= target_date]
+                target_date = naive_utc(datetime.fromisoformat(target_date_str))
             except ValueError:
                 return jsonify({'error': f'Invalid target_date format: {target_date_str}. Use ISO format.'}), 400
 
+        # All active filters in a single pass over the actions
+        dated = start_date is not None or target_date is not None
+        if has_measurements or has_duration or dated:
+            actions = [
+                a for a in actions
+                if (not has_measurements or a.measurement_units_by_amount is not None)
+                and (not has_duration or a.duration_minutes is not None)
+                and (not dated or (a.log_time
+                                   and (start_date is None or a.log_time >= start_date)
+                                   and (target_date is None or a.log_time <= target_date)))
+            ]
+
         # Serialize actions
         actions_data = [serialize(a, include_type=True) for a in actions]
 
@@ -304,7 +309,10 @@ def get_action_goals(action_id: int):
         goal_service = GoalStorageService()
         goals = goal_service.get_all()
 
-        # Infer matches for this action (infer_matches expects lists)
+        # Infer matches for this action (infer_matches expects lists).
+        # Imported here: only this endpoint matches, so the module loads
+        # without the matching modules
+        from ethica.progress_matching import infer_matches
         matches = infer_matches(actions=[action], goals=goals)
 
         # Serialize matches (list of ActionGoalRelationship objects)
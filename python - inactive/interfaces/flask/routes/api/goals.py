@@ -13,8 +13,6 @@ from datetime import datetime
 from . import api_bp
 from rhetorica.storage_service import GoalStorageService, ActionStorageService
 from rhetorica.serializers import serialize, deserialize
-from ethica.progress_matching import infer_matches
-from ethica.progress_aggregation import aggregate_goal_progress
 from categoriae.goals import Goal, Milestone, SmartGoal
 from config.logging_setup import get_logger
 
@@ -50,11 +48,13 @@ def get_goals():
         has_dates = request.args.get('has_dates', '').lower() == 'true'
         has_target = request.args.get('has_target', '').lower() == 'true'
 
-        if has_dates:
-            goals = [g for g in goals if g.is_time_bound()]
-
-        if has_target:
-            goals = [g for g in goals if g.is_measurable()]
+        # Both predicates in a single pass over the goals
+        if has_dates or has_target:
+            goals = [
+                g for g in goals
+                if (not has_dates or g.is_time_bound())
+                and (not has_target or g.is_measurable())
+            ]
 
         # Serialize goals (include_type=True adds 'type' field with class name)
         goals_data = [serialize(g, include_type=True) for g in goals]
@@ -320,9 +320,16 @@ def get_goal_progress(goal_id: int):
         if not goal:
             return jsonify({'error': f'Goal {goal_id} not found'}), 404
 
-        # Fetch all actions for matching
+        # Imported here: only the progress endpoint matches, so the module
+        # loads without the matching modules
+        from ethica.progress_matching import goal_period, infer_matches
+        from ethica.progress_aggregation import aggregate_goal_progress
+
+        # Fetch the actions that could match: a dated goal only accepts
+        # actions logged in its period, so only those rows are loaded
         action_service = ActionStorageService()
-        actions = action_service.get_all()
+        period = goal_period(goal)
+        actions = action_service.get_all() if period is None else action_service.get_logged_between(*period)
 
         # Infer matches for this goal
         all_matches = infer_matches(actions, [goal])
@@ -9,24 +9,57 @@ Written by Claude Code on 2025-10-14.
 
 from flask import request, jsonify
 from datetime import datetime
+from typing import Optional
 
 from . import api_bp
-from rhetorica.storage_service import TermStorageService, GoalStorageService, ActionStorageService
+from rhetorica.storage_service import (
+    TermStorageService, GoalStorageService, ActionStorageService, get_all_together
+)
 from rhetorica.serializers import serialize, deserialize
 from ethica.term_lifecycle import (
     get_active_term,
-    get_committed_goals,
-    get_overlapping_goals,
+    get_all_term_goals,
     get_actions_in_term,
     calculate_term_progress,
-    prepare_terms_list_view,
-    get_term_status
+    prepare_terms_list_view
 )
 from categoriae.terms import GoalTerm
 from config.logging_setup import get_logger
 
 logger = get_logger(__name__)
 
+# Statuses returned by get_term_status(), in the order error messages list them
+_TERM_STATUSES = ('active', 'upcoming', 'complete')
+
+
+def _term_with_metrics(term: GoalTerm, goals: list, check: Optional[datetime] = None) -> dict:
+    """
+    Response body for one term: the term plus its status and metrics.
+
+    Shared by GET /api/terms/<id> and GET /api/terms/active, so a route that
+    has already loaded a term renders it directly instead of fetching it again.
+
+    Args:
+        term: Term to describe
+        goals: All goals, for committed/overlapping counts
+        check: Moment to measure from (defaults to now)
+    """
+    # Calculate metrics using business logic
+    term_goals = get_all_term_goals(term, goals)
+    committed, overlapping = term_goals['committed'], term_goals['overlapping']
+    # One check time for status and progress (progress includes status)
+    progress = calculate_term_progress(term, committed, check)
+
+    return {
+        'term': serialize(term, include_type=False),
+        'status': progress['status'],
+        'days_elapsed': progress['days_elapsed'],
+        'days_remaining': progress['days_remaining'],
+        'progress_percent': round(progress['percent_time_complete'] * 100, 1),
+        'committed_goal_count': len(committed),
+        'overlapping_goal_count': len(overlapping)
+    }
+
 
 # ===== API ENDPOINTS =====
 
@@ -47,11 +80,8 @@ def get_terms():
         GET /api/terms?status=active
     """
     try:
-        term_service = TermStorageService()
-        goal_service = GoalStorageService()
-
-        terms = term_service.get_all()
-        goals = goal_service.get_all()
+        # Terms and goals in one database round-trip
+        terms, goals = get_all_together(TermStorageService(), GoalStorageService())
 
         # Use business logic to enrich terms with status/metrics
         enriched_terms = prepare_terms_list_view(terms, goals)
@@ -59,20 +89,28 @@ def get_terms():
         # Apply status filter if provided
         status_filter = request.args.get('status')
         if status_filter:
-            valid_statuses = ['active', 'upcoming', 'complete']
-            if status_filter not in valid_statuses:
+            if status_filter not in _TERM_STATUSES:
                 return jsonify({
-                    'error': f'Invalid status filter. Must be one of: {", ".join(valid_statuses)}'
+                    'error': f'Invalid status filter. Must be one of: {", ".join(_TERM_STATUSES)}'
                 }), 400
 
-            enriched_terms = [t for t in enriched_terms if t['status'] == status_filter]
-
-        # Serialize the term objects within enriched data
-        for item in enriched_terms:
-            item['term'] = serialize(item['term'], include_type=False)
+            enriched_terms = [row for row in enriched_terms if row.status == status_filter]
+
+        # Rows are TermListRow dataclasses holding plain values; only the term
+        # within needs serializing
+        terms_data = [
+            {
+                'term': serialize(row.term, include_type=False),
+                'status': row.status,
+                'committed_goal_count': row.committed_goal_count,
+                'days_remaining': row.days_remaining,
+                'progress_percent': row.progress_percent,
+            }
+            for row in enriched_terms
+        ]
 
         return jsonify({
-            'terms': enriched_terms,
+            'terms': terms_data,
             'count': len(enriched_terms),
             'filters': {
                 'status': status_filter
@@ -110,21 +148,7 @@ def get_term(term_id: int):
         goal_service = GoalStorageService()
         goals = goal_service.get_all()
 
-        # Calculate metrics using business logic
-        committed = get_committed_goals(term, goals)
-        overlapping = get_overlapping_goals(term, goals)
-        status = get_term_status(term)
-        progress = calculate_term_progress(term, committed)
-
-        return jsonify({
-            'term': serialize(term, include_type=False),
-            'status': status,
-            'days_elapsed': progress['days_elapsed'],
-            'days_remaining': progress['days_remaining'],
-            'progress_percent': round(progress['percent_time_complete'] * 100, 1),
-            'committed_goal_count': len(committed),
-            'overlapping_goal_count': len(overlapping)
-        }), 200
+        return jsonify(_term_with_metrics(term, goals)), 200
 
     except Exception as e:
         logger.error(f"Error fetching term {term_id}: {e}", exc_info=True)
@@ -296,11 +320,9 @@ def get_active_term_endpoint():
         GET /api/terms/active
     """
     try:
-        term_service = TermStorageService()
-        terms = term_service.get_all()
-
-        # Use business logic to find active term
-        active_term = get_active_term(terms)
+        # Only terms covering "now" are loaded; business logic picks among them
+        now = datetime.now()
+        active_term = get_active_term(TermStorageService().get_spanning(now), now)
 
         if not active_term:
             return jsonify({
@@ -308,23 +330,12 @@ def get_active_term_endpoint():
                 'message': 'No active term found'
             }), 200
 
-        # Get metrics for active term
+        # Metrics for the term already loaded, as of the same "now" that
+        # selected it (so its status is 'active')
         goal_service = GoalStorageService()
         goals = goal_service.get_all()
 
-        committed = get_committed_goals(active_term, goals)
-        overlapping = get_overlapping_goals(active_term, goals)
-        progress = calculate_term_progress(active_term, committed)
-
-        return jsonify({
-            'term': serialize(active_term, include_type=False),
-            'status': 'active',
-            'days_elapsed': progress['days_elapsed'],
-            'days_remaining': progress['days_remaining'],
-            'progress_percent': round(progress['percent_time_complete'] * 100, 1),
-            'committed_goal_count': len(committed),
-            'overlapping_goal_count': len(overlapping)
-        }), 200
+        return jsonify(_term_with_metrics(active_term, goals, now)), 200
 
     except Exception as e:
         logger.error(f"Error fetching active term: {e}", exc_info=True)
@@ -378,7 +389,7 @@ def add_goal_to_term(term_id: int):
         if not term:
             return jsonify({'error': f'Term {term_id} not found'}), 404
 
-        # Check if goal already assigned
+        # Check if goal already assigned (set lookup, not a list scan)
         if goal_id in term.term_goals_by_id:
             return jsonify({'error': f'Goal {goal_id} already assigned to term {term_id}'}), 400
 
@@ -426,7 +437,7 @@ def remove_goal_from_term(term_id: int, goal_id: int):
         if not term:
             return jsonify({'error': f'Term {term_id} not found'}), 404
 
-        # Check if goal is assigned to this term
+        # Check if goal is assigned to this term (set lookup, not a list scan)
         if goal_id not in term.term_goals_by_id:
             return jsonify({'error': f'Goal {goal_id} not assigned to term {term_id}'}), 404
 
@@ -480,19 +491,16 @@ def get_term_progress_endpoint(term_id: int):
         if not term:
             return jsonify({'error': f'Term {term_id} not found'}), 404
 
-        # Fetch goals and actions
-        goal_service = GoalStorageService()
-        action_service = ActionStorageService()
-
-        goals = goal_service.get_all()
-        actions = action_service.get_all()
+        # Fetch goals and actions in one database round-trip
+        goals, actions = get_all_together(GoalStorageService(), ActionStorageService())
 
         # Calculate using business logic
-        committed = get_committed_goals(term, goals)
-        overlapping = get_overlapping_goals(term, goals)
+        term_goals = get_all_term_goals(term, goals)
+        committed, overlapping = term_goals['committed'], term_goals['overlapping']
         term_actions = get_actions_in_term(term, actions)
-        status = get_term_status(term)
+        # One check time for status and progress (progress includes status)
         progress = calculate_term_progress(term, committed)
+        status = progress['status']
 
         return jsonify({
             'term': serialize(term, include_type=False),
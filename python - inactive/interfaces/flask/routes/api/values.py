@@ -18,6 +18,9 @@ from config.logging_setup import get_logger
 
 logger = get_logger(__name__)
 
+# Accepted incentive_type / type filter values, in the order error messages list them
+_VALUE_TYPES = ('major', 'highest_order', 'life_area', 'general')
+
 
 # ===== API ENDPOINTS =====
 
@@ -48,10 +51,9 @@ def get_values():
         domain_filter = request.args.get('domain')
 
         # Validate type_filter if provided
-        valid_types = ['major', 'highest_order', 'life_area', 'general']
-        if type_filter and type_filter not in valid_types:
+        if type_filter and type_filter not in _VALUE_TYPES:
             return jsonify({
-                'error': f'Invalid type filter. Must be one of: {", ".join(valid_types)}'
+                'error': f'Invalid type filter. Must be one of: {", ".join(_VALUE_TYPES)}'
             }), 400
 
         # Get filtered values
@@ -148,11 +150,9 @@ def create_value():
             return jsonify({'error': 'Field "description" is required'}), 400
 
         incentive_type = data['incentive_type'].lower()
-        valid_types = ['major', 'highest_order', 'life_area', 'general']
-
-        if incentive_type not in valid_types:
+        if incentive_type not in _VALUE_TYPES:
             return jsonify({
-                'error': f'Invalid incentive_type. Must be one of: {", ".join(valid_types)}'
+                'error': f'Invalid incentive_type. Must be one of: {", ".join(_VALUE_TYPES)}'
             }), 400
 
         # Extract priority (rhetorica will handle conversion and defaults)
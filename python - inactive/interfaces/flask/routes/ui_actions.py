@@ -8,11 +8,13 @@ Written by Claude Code on 2025-10-16.
 """
 
 import json
+from itertools import islice
+from operator import attrgetter
+from typing import Optional
 from flask import Blueprint, render_template, request, redirect, url_for
 from datetime import datetime
 from rhetorica.storage_service import ActionStorageService, GoalStorageService
-from categoriae.actions import Action
-from ethica.inference_service import ActionGoalInferenceService
+from categoriae.actions import Action, naive_utc
 from config.logging_setup import get_logger
 
 logger = get_logger(__name__)
@@ -20,6 +22,21 @@ logger = get_logger(__name__)
 # Create blueprint for UI routes
 ui_actions_bp = Blueprint('ui_actions', __name__, url_prefix='/actions')
 
+# Query-string values of the tri-state has_* filters on the list page
+_FLAG_VALUES = {'true': True, 'false': False}
+
+_measurements = attrgetter('measurement_units_by_amount')
+_log_time = attrgetter('log_time')
+
+
+def _measurement_summary(measurements: Optional[dict]) -> str:
+    """List-page cell: 'km: 5.0, minutes: 30', or the first two then '... +N more'."""
+    if not measurements:
+        return '-'
+    shown = ', '.join(f"{key}: {value}" for key, value in islice(measurements.items(), 2))
+    extra = len(measurements) - 2
+    return f"{shown}, ... +{extra} more" if extra > 0 else shown
+
 
 @ui_actions_bp.route('/')
 def actions_home():
@@ -52,31 +69,38 @@ def actions_list():
         has_measurements = request.args.get('has_measurements')
         has_duration = request.args.get('has_duration')
 
-        # Date filtering
-        if from_date_str:
-            from_date = datetime.fromisoformat(from_date_str)
-            actions = [a for a in actions if a.log_time >= from_date]
-
-        if to_date_str:
-            to_date = datetime.fromisoformat(to_date_str)
-            actions = [a for a in actions if a.log_time <= to_date]
-
-        # Feature filtering
-        if has_measurements == 'true':
-            actions = [a for a in actions if a.measurement_units_by_amount]
-        elif has_measurements == 'false':
-            actions = [a for a in actions if not a.measurement_units_by_amount]
-
-        if has_duration == 'true':
-            actions = [a for a in actions if a.duration_minutes is not None]
-        elif has_duration == 'false':
-            actions = [a for a in actions if a.duration_minutes is None]
+        # Date bounds are parsed once and compared with each action's log_time;
+        # aware ones are normalized to naive UTC like the stored log times
+        since = naive_utc(datetime.fromisoformat(from_date_str)) if from_date_str else None
+        until = naive_utc(datetime.fromisoformat(to_date_str)) if to_date_str else None
+
+        # Feature filters are tri-state: 'true'/'false' select, anything else
+        # (including absent) leaves the feature unfiltered
+        want_measurements = _FLAG_VALUES.get(has_measurements)
+        want_duration = _FLAG_VALUES.get(has_duration)
+
+        # All active filters in a single pass over the actions
+        dated = since is not None or until is not None
+        if dated or want_measurements is not None or want_duration is not None:
+            actions = [
+                a for a in actions
+                if (not dated or (a.log_time
+                                  and (since is None or a.log_time >= since)
+                                  and (until is None or a.log_time <= until)))
+                and (want_measurements is None or bool(a.measurement_units_by_amount) is want_measurements)
+                and (want_duration is None or (a.duration_minutes is not None) is want_duration)
+            ]
 
         # Sort by log_time descending (most recent first)
-        actions = sorted(actions, key=lambda a: a.log_time, reverse=True)
+        actions = sorted(actions, key=_log_time, reverse=True)
+
+        # Measurement cells are formatted here in one map() over the actions
+        # rather than by per-row template logic
+        summaries = map(_measurement_summary, map(_measurements, actions))
 
         return render_template('actions_list.html',
                              actions=actions,
+                             rows=list(zip(actions, summaries)),
                              from_date=from_date_str,
                              to_date=to_date_str,
                              has_measurements=has_measurements,
@@ -285,13 +309,13 @@ def actions_goals(action_id: int):
         # Get all goals
         all_goals = goal_service.get_all()
 
-        # Use inference service to find matches
+        # Use inference service to find matches. Imported here: only this
+        # page matches, so the blueprint loads without the matching modules
+        from ethica.inference_service import ActionGoalInferenceService
         inference = ActionGoalInferenceService(action_service, goal_service)
+        # Already sorted by confidence (highest first)
         matches = inference.infer_for_new_action(action, all_goals)
 
-        # Sort by match strength
-        matches = sorted(matches, key=lambda m: m.match_strength, reverse=True)
-
         return render_template('actions_goals.html',
                              action=action,
                              matches=matches)
@@ -48,11 +48,13 @@ def goals_list():
         # Fetch goals with type filter
         goals = service.get_all(type_filter=type_filter)
 
-        # Apply additional filters
-        if has_dates:
-            goals = [g for g in goals if g.is_time_bound()]
-        if has_target:
-            goals = [g for g in goals if g.is_measurable()]
+        # Apply additional filters in a single pass over the goals
+        if has_dates or has_target:
+            goals = [
+                g for g in goals
+                if (not has_dates or g.is_time_bound())
+                and (not has_target or g.is_measurable())
+            ]
 
         return render_template('goals_list.html',
                              goals=goals,
@@ -92,11 +94,9 @@ def goals_add():
         # Parse date fields
         start_date_str = request.form.get('start_date')
         target_date_str = request.form.get('target_date')
-        target_date_str = request.form.get('target_date')
 
         start_date = datetime.fromisoformat(start_date_str) if start_date_str else None
         target_date = datetime.fromisoformat(target_date_str) if target_date_str else None
-        target_date = datetime.fromisoformat(target_date_str) if target_date_str else None
 
         # SMART-specific fields
         how_goal_is_relevant = request.form.get('how_goal_is_relevant')
@@ -9,8 +9,9 @@ Written by Claude Code on 2025-10-16.
 
 from flask import Blueprint, render_template, request, redirect, url_for
 from datetime import datetime
+from operator import attrgetter
 from rhetorica.storage_service import TermStorageService, GoalStorageService
-from categoriae.terms import GoalTerm
+from categoriae.terms import GoalTerm, frozen_now
 from ethica.term_lifecycle import get_terms_by_status, get_term_status
 from config.logging_setup import get_logger
 
@@ -45,18 +46,21 @@ def terms_list():
         # Fetch all terms
         all_terms = service.get_all()
 
-        # Apply status filter using ethica business logic
-        if status_filter:
-            terms = get_terms_by_status(all_terms, status_filter)
-        else:
-            terms = all_terms
-
-        # Sort by start_date descending (most recent first)
-        terms = sorted(terms, key=lambda t: t.start_date, reverse=True)
-
-        return render_template('terms_list.html',
-                             terms=terms,
-                             current_status=status_filter)
+        # One clock read for the whole page: the filter and every row's
+        # days_remaining()/is_active() in the template agree on "now"
+        with frozen_now():
+            # Apply status filter using ethica business logic
+            if status_filter:
+                terms = get_terms_by_status(all_terms, status_filter)
+            else:
+                terms = all_terms
+
+            # Sort by start_date descending (most recent first)
+            terms = sorted(terms, key=attrgetter('start_date'), reverse=True)
+
+            return render_template('terms_list.html',
+                                 terms=terms,
+                                 current_status=status_filter)
 
     except Exception as e:
         logger.error(f"Error listing terms: {e}", exc_info=True)
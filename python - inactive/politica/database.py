@@ -13,8 +13,9 @@ All methods accept/return dicts, never domain objects like Action or Goal.
 import sqlite3
 import json
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 from contextlib import contextmanager
+from functools import lru_cache
 from config import DB_PATH, SCHEMA_PATH
 from config.logging_setup import get_logger
 
@@ -303,6 +304,100 @@ class Database:
             logger.debug(f"Query returned {len(results)} rows")
             return results
 
+    def query_spanning(self, table: str, value: str, start_column: str, end_column: str) -> List[dict]:
+        """
+        Fetch records whose [start_column, end_column] range contains value.
+
+        Lets SQLite narrow a table to the rows covering one moment instead of
+        returning every row for the caller to scan. Values are compared via
+        julianday(), so ISO strings written with a 'T' or a space between
+        date and time (the Swift app writes the latter) order by the moment
+        they name rather than as text. julianday() keeps only milliseconds;
+        callers needing an exact bound should re-check in Python.
+
+        Args:
+            table: Name of the database table
+            value: Value to look for, e.g. a datetime's isoformat()
+            start_column: Column holding each range's start
+            end_column: Column holding each range's end
+
+        Returns:
+            Matching rows as dicts, in rowid (insertion) order like query()
+
+        Example:
+            # Terms running right now
+            rows = db.query_spanning('terms', datetime.now().isoformat(), 'start_date', 'target_date')
+        """
+        sql = (f"SELECT * FROM {table} "
+               f"WHERE julianday({start_column}) <= julianday(?) AND julianday(?) <= julianday({end_column}) "
+               f"ORDER BY rowid")
+        logger.debug(f"SQL: {sql}")
+
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(sql, [value, value])
+            return [dict(row) for row in cursor.fetchall()]
+
+    def query_between(self, table: str, column: str, low: str, high: str) -> List[dict]:
+        """
+        Fetch records whose column value lies in [low, high], bounds inclusive.
+
+        The counterpart of query_spanning() for point values: SQLite narrows
+        the table to one range instead of returning every row. Values are
+        compared via julianday(), as in query_spanning(), so either ISO
+        date/time separator is accepted.
+
+        Args:
+            table: Name of the database table
+            column: Column to range over
+            low: Lowest value to include, e.g. a datetime's isoformat()
+            high: Highest value to include
+
+        Returns:
+            Matching rows as dicts, in rowid (insertion) order like query()
+
+        Example:
+            # Actions logged during a goal's period
+            rows = db.query_between('actions', 'log_time', start.isoformat(), end.isoformat())
+        """
+        sql = f"SELECT * FROM {table} WHERE julianday({column}) BETWEEN julianday(?) AND julianday(?) ORDER BY rowid"
+        logger.debug(f"SQL: {sql}")
+
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(sql, [low, high])
+            return [dict(row) for row in cursor.fetchall()]
+
+    def query_many(self, tables: List[str]) -> Dict[str, List[dict]]:
+        """
+        Fetch all records from several tables over one connection.
+
+        For callers that always need the same tables together (e.g. goals and
+        actions for matching), this opens, commits, and closes one connection
+        instead of one per table.
+
+        Args:
+            tables: Names of the database tables
+
+        Returns:
+            Dict mapping each table name to its rows, as query() returns them
+
+        Example:
+            rows = db.query_many(['goals', 'actions'])
+            goal_rows, action_rows = rows['goals'], rows['actions']
+        """
+        logger.info(f"Querying all records from {', '.join(tables)}")
+
+        results = {}
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            for table in tables:
+                cursor.execute(f"SELECT * FROM {table}")
+                results[table] = [dict(row) for row in cursor.fetchall()]
+                logger.debug(f"Query returned {len(results[table])} rows from {table}")
+
+        return results
+
     def insert(self, table: str, records: List[dict]):
         """
         Insert records into a database table.
@@ -590,3 +685,18 @@ class Database:
             'archived': True
         }
 
+
+@lru_cache(maxsize=None)
+def default_database() -> Database:
+    """
+    The Database at the configured default paths, created once per process.
+
+    A Database holds only its paths - every operation opens its own
+    connection - so one instance can serve all storage services and threads.
+    Services are built per request; sharing this instance runs the
+    exists/initialize check (and its log line) once instead of per service.
+
+    Returns:
+        The shared Database(DB_PATH, SCHEMA_PATH) instance
+    """
+    return Database()
@@ -9,7 +9,7 @@ Written by Claude Code on 2025-10-21
 
 from uuid import uuid4
 from typing import List, Dict, Optional
-from politica.database import Database
+from politica.database import Database, default_database
 from config.logging_setup import get_logger
 
 logger = get_logger(__name__)
@@ -21,7 +21,7 @@ def backfill_uuids_for_table(table: str, db: Optional[Database] = None) -> Dict[
 
     Args:
         table: Table name (e.g., 'actions', 'goals', 'personal_values', 'terms')
-        db: Database instance (creates default if None)
+        db: Database instance (shared default if None)
 
     Returns:
         Dict with migration statistics:
@@ -38,7 +38,7 @@ def backfill_uuids_for_table(table: str, db: Optional[Database] = None) -> Dict[
         >>> print(f"Updated {stats['records_updated']} actions with UUIDs")
     """
     if db is None:
-        db = Database()
+        db = default_database()
 
     logger.info(f"Starting UUID backfill for table: {table}")
 
@@ -110,7 +110,7 @@ def backfill_all_tables(tables: Optional[List[str]] = None, db: Optional[Databas
 
     Args:
         tables: List of table names (defaults to standard entity tables)
-        db: Database instance (creates default if None)
+        db: Database instance (shared default if None)
 
     Returns:
         List of statistics dicts (one per table)
@@ -124,7 +124,7 @@ def backfill_all_tables(tables: Optional[List[str]] = None, db: Optional[Databas
         tables = ['actions', 'goals', 'personal_values', 'terms']
 
     if db is None:
-        db = Database()
+        db = default_database()
 
     logger.info(f"Starting UUID backfill for {len(tables)} tables")
 
@@ -148,7 +148,7 @@ def verify_uuid_coverage(table: str, db: Optional[Database] = None) -> Dict[str,
 
     Args:
         table: Table name
-        db: Database instance (creates default if None)
+        db: Database instance (shared default if None)
 
     Returns:
         Dict with coverage statistics:
@@ -165,7 +165,7 @@ def verify_uuid_coverage(table: str, db: Optional[Database] = None) -> Dict[str,
         >>> print(f"UUID coverage: {stats['coverage_percent']:.1f}%")
     """
     if db is None:
-        db = Database()
+        db = default_database()
 
     all_records = db.query(table)
     total = len(all_records)
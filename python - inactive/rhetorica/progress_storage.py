@@ -13,9 +13,9 @@ Written by Claude Code on 2025-10-12
 from typing import List, Optional
 from categoriae.actions import Action
 from categoriae.goals import Goal
-from categoriae.relationships import ActionGoalRelationship
+from categoriae.relationships import ActionGoalRelationship, AssignmentMethod
 from rhetorica.storage_service import ActionStorageService, GoalStorageService
-from politica.database import Database
+from politica.database import Database, default_database
 from config.logging_setup import get_logger
 
 logger = get_logger(__name__)
@@ -39,9 +39,9 @@ class ActionGoalProgressStorageService:
         Initialize with database connection and entity services.
 
         Args:
-            database: Database instance. If None, creates default instance.
+            database: Database instance. If None, uses the shared default instance.
         """
-        self.db = database or Database()
+        self.db = database or default_database()
         self.action_service = ActionStorageService(database=self.db)
         self.goal_service = GoalStorageService(database=self.db)
 
@@ -173,7 +173,7 @@ class ActionGoalProgressStorageService:
     def get_relationships(self,
                          action_id: Optional[int] = None,
                          goal_id: Optional[int] = None,
-                         method: Optional[str] = None) -> List[ActionGoalRelationship]:
+                         method: Optional[AssignmentMethod] = None) -> List[ActionGoalRelationship]:
         """
         Retrieve relationships from database, reconstructed as domain objects.
 
@@ -197,6 +197,9 @@ class ActionGoalProgressStorageService:
         records = self.db.query(self.table_name, filters=filters)
 
         relationships = []
+        # Known methods become enum members; anything else keeps its raw string
+        methods = AssignmentMethod._value2member_map_
+
         for record in records:
             # Fetch full entities by ID
             action = self.action_service.get_by_id(record['action_id'])
@@ -214,7 +217,7 @@ class ActionGoalProgressStorageService:
                 action=action,
                 goal=goal,
                 contribution=record['contribution'],
-                assignment_method=record['match_method'],
+                assignment_method=methods.get(record['match_method'], record['match_method']),
                 confidence=record.get('confidence', 1.0)
             ))
 
@@ -253,14 +256,14 @@ class ActionGoalProgressStorageService:
         existing_auto = self.db.query(self.table_name, filters={
             'action_id': action_id,
             'goal_id': goal_id,
-            'match_method': 'auto_inferred'
+            'match_method': AssignmentMethod.AUTO_INFERRED
         })
 
         if existing_auto:
             self.db.archive_and_delete(
                 self.table_name,
                 filters={'action_id': action_id, 'goal_id': goal_id,
-                        'match_method': 'auto_inferred'},
+                        'match_method': AssignmentMethod.AUTO_INFERRED},
                 reason='replaced_with_manual',
                 notes=reason,
                 confirm=True
@@ -270,7 +273,7 @@ class ActionGoalProgressStorageService:
         existing_manual = self.db.query(self.table_name, filters={
             'action_id': action_id,
             'goal_id': goal_id,
-            'match_method': 'manual'
+            'match_method': AssignmentMethod.MANUAL
         })
 
         if existing_manual:
@@ -282,7 +285,7 @@ class ActionGoalProgressStorageService:
             'action_id': action_id,
             'goal_id': goal_id,
             'contribution': contribution,
-            'match_method': 'manual',
+            'match_method': AssignmentMethod.MANUAL,
             'confidence': None,  # Not applicable for manual
             'matched_on': reason
         }])
@@ -310,7 +313,7 @@ class ActionGoalProgressStorageService:
         existing = self.db.query(self.table_name, filters={
             'action_id': action_id,
             'goal_id': goal_id,
-            'match_method': 'auto_inferred'
+            'match_method': AssignmentMethod.AUTO_INFERRED
         })
 
         if not existing:
@@ -323,7 +326,7 @@ class ActionGoalProgressStorageService:
         self.db.update(
             table=self.table_name,
             record_id=record_id,
-            updates={'match_method': 'user_confirmed'},
+            updates={'match_method': AssignmentMethod.USER_CONFIRMED},
             notes='User confirmed auto-inferred match'
         )
 
@@ -372,7 +375,7 @@ class ActionGoalProgressStorageService:
         Returns:
             int: Number of relationships invalidated
         """
-        filters = {'match_method': 'auto_inferred'}
+        filters = {'match_method': AssignmentMethod.AUTO_INFERRED}
         if action_id is not None:
             filters['action_id'] = action_id
 
@@ -11,10 +11,126 @@ Updated by Claude Code on 2025-10-21 to add UUID support
 
 from dataclasses import fields, is_dataclass
 from datetime import datetime, date
-from typing import Any
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, Callable, Optional, Tuple
 from uuid import UUID
 import json
 
+# Stored dict/list fields are decoded on every row read; orjson does that
+# several times faster when installed. It rejects some text json.loads
+# accepts (NaN/Infinity, integers wider than 64 bits), so those rows are
+# retried with the stdlib, whose JSONDecodeError the except clauses below catch.
+try:
+    import orjson
+except ImportError:
+    _json_loads = json.loads
+else:
+    def _json_loads(text: str) -> Any:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            return json.loads(text)
+
+
+# Encoders for exact value types, looked up with a single dict hit per value
+_ENCODERS = {
+    UUID: str,
+    datetime: datetime.isoformat,
+    date: date.isoformat,
+}
+
+
+@lru_cache(maxsize=None)
+def _field_plan(entity_class: type) -> Tuple[Tuple[str, Callable[[Any], Any]], ...]:
+    """
+    Resolve (field_name, getter) pairs for a dataclass once per class.
+
+    Private fields (leading underscore) hold derived/cached state, not
+    persisted data, so they are left out of the plan.
+    """
+    return tuple((f.name, attrgetter(f.name))
+                 for f in fields(entity_class) if not f.name.startswith('_'))
+
+
+def _decode_uuid(value: Any, json_decode: bool) -> Any:
+    return UUID(value) if isinstance(value, str) else value  # else already UUID
+
+
+def _decode_datetime(value: Any, json_decode: bool) -> Any:
+    return datetime.fromisoformat(value) if isinstance(value, str) else value
+
+
+def _decode_date(value: Any, json_decode: bool) -> Any:
+    return datetime.strptime(value, '%Y-%m-%d').date() if isinstance(value, str) else value
+
+
+def _json_decoder(opening: Any) -> Callable[[Any, bool], Any]:
+    """Decoder for JSON-stored fields whose text starts with `opening`."""
+    def decode(value: Any, json_decode: bool) -> Any:
+        if json_decode and isinstance(value, str) and value.strip().startswith(opening):
+            try:
+                return _json_loads(value)
+            except json.JSONDecodeError:
+                # Not valid JSON, keep as string (shouldn't happen but defensive)
+                return value
+        return value  # Already dict/list or not JSON
+    return decode
+
+
+_decode_dict = _json_decoder('{')
+_decode_list = _json_decoder('[')
+# Union[str, dict] and friends: try JSON decode first, fall back to string
+_decode_union = _json_decoder(('{', '['))
+
+
+@lru_cache(maxsize=None)
+def _decode_plan(entity_class: type) -> Tuple[Tuple[str, Optional[Callable[[Any, bool], Any]]], ...]:
+    """
+    Resolve (field_name, decoder) pairs for a dataclass once per class.
+
+    Unwrapping Optional[T] and matching the annotation against the types
+    deserialize() understands depends only on the class, so it is done here
+    rather than for every field of every row. A None decoder means the
+    stored value is used as-is.
+    """
+    plan = []
+    for field in fields(entity_class):
+        field_type = field.type
+
+        # Extract type from Optional[T], Union[T, None], etc.
+        origin = getattr(field_type, '__origin__', None)
+        type_args = getattr(field_type, '__args__', ())
+
+        # Handle Optional[T] and Union[T, None] by extracting non-None types
+        if origin is type(None) or (hasattr(field_type, '__class__') and 'Union' in str(origin)):
+            non_none_types = [t for t in type_args if t is not type(None)]
+            if len(non_none_types) == 1:
+                # Optional[T] or Union[T, None] - use T
+                field_type = non_none_types[0]
+                origin = getattr(field_type, '__origin__', None)
+            elif len(non_none_types) > 1:
+                plan.append((field.name, _decode_union))
+                continue
+
+        if field_type == UUID:
+            decode = _decode_uuid
+        elif field_type == datetime:
+            decode = _decode_datetime
+        elif field_type == date:
+            decode = _decode_date
+        elif origin is dict or field_type == dict:
+            # Handles dict and Dict[K, V]
+            decode = _decode_dict
+        elif origin is list or field_type == list:
+            # Handles list and List[T]
+            decode = _decode_list
+        else:
+            decode = None
+        plan.append((field.name, decode))
+
+    return tuple(plan)
+
 
 def serialize(entity: Any, include_type: bool = True, json_encode: bool = False) -> dict:
     """
@@ -56,28 +172,30 @@ def serialize(entity: Any, include_type: bool = True, json_encode: bool = False)
 
     result = {}
 
-    for field in fields(entity):
-        value = getattr(entity, field.name)
-        db_field_name = field.name
+    for db_field_name, getter in _field_plan(type(entity)):
+        value = getter(entity)
 
         if value is None:
             result[db_field_name] = None
             continue
 
-        # Serialize based on detected type
-        if isinstance(value, UUID):
-            # Convert UUID to string for storage
-            result[db_field_name] = str(value)
-        elif isinstance(value, datetime):
-            result[db_field_name] = value.isoformat()
-        elif isinstance(value, date):
-            result[db_field_name] = value.isoformat()
+        # Serialize based on detected type - exact-type table first, then
+        # isinstance checks for subclasses
+        encode = _ENCODERS.get(type(value))
+        if encode is not None:
+            result[db_field_name] = encode(value)
         elif isinstance(value, (dict, list)):
             # Keep as dict/list for in-memory use, or convert to JSON for database
             if json_encode:
                 result[db_field_name] = json.dumps(value)
             else:
                 result[db_field_name] = value
+        elif isinstance(value, UUID):
+            # Convert UUID to string for storage
+            result[db_field_name] = str(value)
+        elif isinstance(value, date):
+            # Covers datetime subclasses too
+            result[db_field_name] = value.isoformat()
         else:
             # Primitive types (int, str, float, bool) - keep as-is
             result[db_field_name] = value
@@ -128,102 +246,19 @@ def deserialize(data: dict, entity_class: type, json_decode: bool = False) -> An
 
     parsed = {}
 
-    for field in fields(entity_class):
-        if field.name not in data:
+    for field_name, decode in _decode_plan(entity_class):
+        if field_name not in data:
             # Field not in data - let dataclass default handle it
             continue
 
-        value = data[field.name]
-
-        if value is None:
-            parsed[field.name] = None
-            continue
+        value = data[field_name]
 
-        # Parse based on field type annotation
-        field_type = field.type
-
-        # Extract type from Optional[T], Union[T, None], etc.
-        origin = getattr(field_type, '__origin__', None)
-        type_args = getattr(field_type, '__args__', ())
-
-        # Handle Optional[T] and Union[T, None] by extracting non-None types
-        if origin is type(None) or (hasattr(field_type, '__class__') and 'Union' in str(origin)):
-            non_none_types = [t for t in type_args if t is not type(None)]
-            if len(non_none_types) == 1:
-                # Optional[T] or Union[T, None] - use T
-                field_type = non_none_types[0]
-                origin = getattr(field_type, '__origin__', None)
-                type_args = getattr(field_type, '__args__', ())
-            elif len(non_none_types) > 1:
-                # Union[str, dict] - handle specially
-                # Try JSON decode first, fall back to string
-                if json_decode and isinstance(value, str) and value.strip().startswith(('{', '[')):
-                    try:
-                        parsed[field.name] = json.loads(value)
-                        continue
-                    except json.JSONDecodeError:
-                        parsed[field.name] = value  # Keep as string
-                        continue
-                else:
-                    parsed[field.name] = value
-                    continue
-
-        # Type-specific parsing
-        if field_type == UUID or field_type is UUID:
-            if isinstance(value, str):
-                parsed[field.name] = UUID(value)
-            else:
-                parsed[field.name] = value  # Already UUID
-        elif field_type == datetime or field_type is datetime:
-            if isinstance(value, str):
-                parsed[field.name] = datetime.fromisoformat(value)
-            else:
-                parsed[field.name] = value  # Already datetime
-        elif field_type == date or field_type is date:
-            if isinstance(value, str):
-                parsed[field.name] = datetime.strptime(value, '%Y-%m-%d').date()
-            else:
-                parsed[field.name] = value  # Already date
-        elif origin is dict and json_decode:
-            # Handles both dict and Dict[K, V]
-            if isinstance(value, str) and value.strip().startswith('{'):
-                try:
-                    parsed[field.name] = json.loads(value)
-                except json.JSONDecodeError:
-                    # Not valid JSON, keep as string (shouldn't happen but defensive)
-                    parsed[field.name] = value
-            else:
-                parsed[field.name] = value  # Already dict or not JSON
-        elif origin is list and json_decode:
-            # Handles both list and List[T]
-            if isinstance(value, str) and value.strip().startswith('['):
-                try:
-                    parsed[field.name] = json.loads(value)
-                except json.JSONDecodeError:
-                    parsed[field.name] = value
-            else:
-                parsed[field.name] = value  # Already list or not JSON
-        elif (field_type == dict or field_type is dict) and json_decode:
-            # Plain dict annotation (fallback for older Python)
-            if isinstance(value, str) and value.strip().startswith('{'):
-                try:
-                    parsed[field.name] = json.loads(value)
-                except json.JSONDecodeError:
-                    parsed[field.name] = value
-            else:
-                parsed[field.name] = value
-        elif (field_type == list or field_type is list) and json_decode:
-            # Plain list annotation (fallback for older Python)
-            if isinstance(value, str) and value.strip().startswith('['):
-                try:
-                    parsed[field.name] = json.loads(value)
-                except json.JSONDecodeError:
-                    parsed[field.name] = value
-            else:
-                parsed[field.name] = value
+        if value is None or decode is None:
+            # None, or a primitive type - keep as-is (includes dict/list
+            # if not json_decode)
+            parsed[field_name] = value
         else:
-            # Primitive types - keep as-is (includes dict/list if not json_decode)
-            parsed[field.name] = value
+            parsed[field_name] = decode(value, json_decode)
 
     # Create instance - dataclass __init__ handles all fields
     return entity_class(**parsed)
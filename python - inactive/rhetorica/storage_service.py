@@ -11,12 +11,13 @@ Contents:
 """
 
 from abc import ABC
-from typing import List, Optional, TypeVar, Generic, Protocol, Type, Union, Any
+from datetime import datetime
+from typing import List, Optional, TypeVar, Generic, Protocol, Tuple, Type, Union, Any
 from categoriae.actions import Action
 from categoriae.goals import Goal, Milestone, SmartGoal
 from categoriae.terms import GoalTerm
 from categoriae.values import Values, MajorValues, HighestOrderValues, LifeAreas, PriorityLevel
-from politica.database import Database
+from politica.database import Database, default_database
 
 # Protocol for entities that can be persisted (have UUID)
 from uuid import UUID
@@ -45,10 +46,10 @@ class StorageService(ABC, Generic[T]):
         Initialize storage service with database connection.
 
         Args:
-            database: Database instance. If None, creates default instance
-                     with default paths from config.
+            database: Database instance. If None, uses the shared default
+                     instance with default paths from config.
         """
-        self.db = database or Database()
+        self.db = database or default_database()
 
     def store_many_instances(self, entities: List[T]) -> List[T]:
         """
@@ -315,6 +316,30 @@ class StorageService(ABC, Generic[T]):
 
 
 
+def get_all_together(*services: StorageService) -> Tuple[List[Any], ...]:
+    """
+    get_all() for several services with one database round-trip.
+
+    The tables are read over a single connection of the first service's
+    database, then each service rebuilds its own entities (so polymorphic
+    services still pick their subclasses).
+
+    Args:
+        services: Storage services whose tables to read
+
+    Returns:
+        Tuple with one entity list per service, in argument order
+
+    Example:
+        >>> goals, actions = get_all_together(GoalStorageService(), ActionStorageService())
+    """
+    rows = services[0].db.query_many([service.table_name for service in services])
+    return tuple(
+        [service._from_dict(record) for record in rows[service.table_name]]
+        for service in services
+    )
+
+
 class ActionStorageService(StorageService[Action]):
     """
     Handles translation between Action objects and database storage.
@@ -325,6 +350,23 @@ class ActionStorageService(StorageService[Action]):
     table_name = 'actions'
     entity_class = Action
 
+    def get_logged_between(self, start: datetime, end: datetime) -> List[Action]:
+        """
+        Actions whose log_time falls within start..end, bounds inclusive.
+
+        Only the rows in range are read and deserialized, so matching against
+        one dated goal need not load the whole action history.
+
+        Args:
+            start: Earliest log_time to include
+            end: Latest log_time to include
+
+        Returns:
+            Actions with IDs, in the order get_all() returns them
+        """
+        records = self.db.query_between(self.table_name, 'log_time', start.isoformat(), end.isoformat())
+        return [self._from_dict(record) for record in records]
+
 
 class TermStorageService(StorageService[GoalTerm]):
     """
@@ -342,6 +384,23 @@ class TermStorageService(StorageService[GoalTerm]):
     table_name = 'terms'
     entity_class = GoalTerm
 
+    def get_spanning(self, moment: datetime) -> List[GoalTerm]:
+        """
+        Terms whose start_date..target_date range contains moment.
+
+        Only the covering rows are read and deserialized, rather than every
+        term. Which of them counts as active is still decided by
+        ethica.term_lifecycle.get_active_term().
+
+        Args:
+            moment: Datetime the terms must cover
+
+        Returns:
+            Covering terms with IDs, in the order get_all() returns them
+        """
+        records = self.db.query_spanning(self.table_name, moment.isoformat(), 'start_date', 'target_date')
+        return [self._from_dict(record) for record in records]
+
 
 # ============================================================================
 # POLYMORPHIC STORAGE SERVICES
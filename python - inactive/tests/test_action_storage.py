@@ -8,6 +8,7 @@ Test database: test_data/testing.db (persists for inspection after tests)
 
 from datetime import datetime
 from categoriae.actions import Action
+from rhetorica.serializers import serialize
 from rhetorica.storage_service import ActionStorageService
 
 
@@ -96,3 +97,38 @@ def test_action_update(test_db):
     assert updated.measurement_units_by_amount == {'distance_km': 10.0}  # Updated field
 
 
+def test_get_logged_between_bounds_inclusive(test_db):
+    """Only actions logged within the range are loaded, in id order"""
+    db, _ = test_db
+    service = ActionStorageService(database=db)
+    service.store_many_instances([
+        Action('Before', log_time=datetime(2025, 2, 28, 23, 59)),
+        Action('First day', log_time=datetime(2025, 3, 1)),
+        Action('Midway', log_time=datetime(2025, 4, 15, 7, 30)),
+        Action('Last moment', log_time=datetime(2025, 5, 31)),
+        Action('After', log_time=datetime(2025, 5, 31, 0, 0, 1)),
+    ])
+
+    in_range = service.get_logged_between(datetime(2025, 3, 1), datetime(2025, 5, 31))
+
+    assert [a.title for a in in_range] == ['First day', 'Midway', 'Last moment']
+
+
+def test_get_logged_between_accepts_both_timestamp_formats(test_db):
+    """'T'- and space-separated log_times are compared as moments at either bound"""
+    db, _ = test_db
+    rows = []
+    for title, log_time in [('Start, T', '2025-03-01T00:00:00'),
+                            ('Start, space', '2025-03-01 00:00:00'),
+                            ('End, T', '2025-05-31T00:00:00'),
+                            ('End, space', '2025-05-31 00:00:00'),
+                            ('After, space', '2025-05-31 00:00:01'),
+                            ('Before, space', '2025-02-28 23:59:59')]:
+        row = serialize(Action(title), include_type=False, json_encode=True)
+        row['log_time'] = log_time
+        rows.append(row)
+    db.insert('actions', rows)
+
+    in_range = ActionStorageService(database=db).get_logged_between(datetime(2025, 3, 1), datetime(2025, 5, 31))
+
+    assert [a.title for a in in_range] == ['Start, T', 'Start, space', 'End, T', 'End, space']
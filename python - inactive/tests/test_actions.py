@@ -11,7 +11,7 @@ Testing philosophy:
 """
 from datetime import datetime
 
-from categoriae.actions import Action
+from categoriae.actions import Action, naive_utc, to_ticks
 
 
 # ===== BASIC CREATION TESTS =====
@@ -99,3 +99,37 @@ def test_action_with_mixed_measurements():
 
     assert action.is_valid()
     assert len(action.measurement_units_by_amount) == 3
+
+
+def test_validity_rechecked_after_reassignment():
+    """is_valid() should reflect fields reassigned after a previous check"""
+    action = Action("Ran")
+    action.measurement_units_by_amount = {"distance_km": 5.0}
+    assert action.is_valid()
+
+    action.measurement_units_by_amount = {"distance_km": -1.0}
+    assert not action.is_valid()
+
+    action.measurement_units_by_amount = {"distance_km": 3.0}
+    action.start_time = datetime(2025, 10, 1, 7, 0)
+    assert not action.is_valid()
+
+
+def test_validity_reflects_in_place_measurement_changes():
+    """Mutating the measurements dict is seen by the next is_valid() call"""
+    action = Action("Ran", measurement_units_by_amount={"distance_km": 5.0})
+    assert action.is_valid()
+
+    action.measurement_units_by_amount["distance_km"] = -1.0
+    assert not action.is_valid()
+
+
+def test_action_accepts_aware_log_time():
+    """A tz-aware log_time (e.g. parsed from '...Z') builds and normalizes to UTC"""
+    aware_time = datetime.fromisoformat("2025-10-01T12:00:00+02:00")
+    aware = Action("Aware", log_time=aware_time)
+
+    assert aware.log_time == aware_time
+    assert naive_utc(aware_time) == datetime(2025, 10, 1, 10, 0)
+    assert to_ticks(aware_time) == to_ticks(datetime(2025, 10, 1, 10, 0))
+    assert naive_utc(datetime(2025, 10, 1, 10, 0)) == datetime(2025, 10, 1, 10, 0)
@@ -6,8 +6,9 @@ This is the essential roundtrip test for the Swift port reference.
 """
 
 from datetime import datetime, timedelta
+from categoriae.actions import Action
 from categoriae.goals import Goal
-from rhetorica.storage_service import GoalStorageService
+from rhetorica.storage_service import ActionStorageService, GoalStorageService, get_all_together
 
 
 def test_goal_roundtrip(test_db):
@@ -42,4 +43,18 @@ def test_goal_roundtrip(test_db):
     assert retrieved.how_goal_is_relevant == original_goal.how_goal_is_relevant
     # ID should be assigned
     assert retrieved.id is not None
-    assert isinstance(retrieved.id, int)
\ No newline at end of file
+    assert isinstance(retrieved.id, int)
+
+
+def test_get_all_together_matches_separate_reads(test_db):
+    """Goals and actions read in one round-trip equal their separate get_all()"""
+    db, _ = test_db
+    goal_service = GoalStorageService(database=db)
+    action_service = ActionStorageService(database=db)
+    goal_service.store_single_instance(Goal(title="Run", measurement_unit="km"))
+    action_service.store_single_instance(Action("Morning run", log_time=datetime.now()))
+
+    goals, actions = get_all_together(goal_service, action_service)
+
+    assert [g.title for g in goals] == [g.title for g in goal_service.get_all()]
+    assert [a.title for a in actions] == [a.title for a in action_service.get_all()]
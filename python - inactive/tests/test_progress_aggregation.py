@@ -8,6 +8,7 @@ Written by Claude Code on 2025-10-12
 """
 
 import pytest
+from dataclasses import replace
 from datetime import datetime
 from categoriae.actions import Action
 from categoriae.goals import Goal, SmartGoal
@@ -16,6 +17,7 @@ from ethica.progress_aggregation import (
     aggregate_goal_progress,
     aggregate_all_goals,
     get_progress_summary,
+    iter_goal_progress,
     GoalProgress
 )
 
@@ -303,3 +305,67 @@ def test_get_progress_summary_with_data(sample_goal, sample_matches):
     assert summary['in_progress_goals'] == 2
     assert summary['avg_completion_percent'] == pytest.approx(20.83, rel=0.01)  # (41.67 + 0) / 2
     assert summary['total_actions_matched'] == 4
+
+
+def test_goal_progress_is_frozen_and_hashable(sample_goal):
+    """GoalProgress is a frozen value object usable as a dict key"""
+    progress = aggregate_goal_progress(sample_goal, [])
+
+    with pytest.raises(AttributeError):
+        progress.total_progress = 5.0
+    assert {progress: 'seen'}[progress] == 'seen'
+
+
+def test_goal_progress_for_unhashable_goal_is_hashable():
+    """Goals that can't be hashed (SmartGoal) still give hashable progress"""
+    smart = SmartGoal(
+        title="Run 50km", measurement_unit="km", measurement_target=50.0,
+        start_date=datetime(2025, 4, 12), target_date=datetime(2025, 6, 21),
+        how_goal_is_relevant="Health", how_goal_is_actionable='{"units": ["km"]}'
+    )
+    progress = aggregate_goal_progress(smart, [])
+
+    assert {progress: 'seen'}[progress] == 'seen'
+
+
+def test_aggregate_all_goals_agrees_with_single_goal(sample_goal, sample_matches):
+    """Batch totals match aggregate_goal_progress, skipping None contributions"""
+    extra = ActionGoalRelationship(action=Action("Untracked"), goal=sample_goal, contribution=None,
+                                   assignment_method="manual", confidence=1.0)
+    matches = sample_matches + [extra]
+
+    [batch] = aggregate_all_goals([sample_goal], matches)
+    single = aggregate_goal_progress(sample_goal, matches)
+
+    assert (batch.total_progress, batch.matching_actions_count) == \
+        (single.total_progress, single.matching_actions_count)
+
+
+def test_aggregate_all_goals_smart_goals_and_equal_copies(sample_goal, sample_matches):
+    """Unhashable SmartGoals aggregate, and matches on an equal copy still count"""
+    smart = SmartGoal(
+        title="Run 50km", measurement_unit="km", measurement_target=50.0,
+        start_date=datetime(2025, 4, 12), target_date=datetime(2025, 6, 21),
+        how_goal_is_relevant="Health", how_goal_is_actionable='{"units": ["km"]}'
+    )
+    copy = replace(sample_goal)
+    on_smart = ActionGoalRelationship(action=Action("Trail run"), goal=smart, contribution=8.0,
+                                      assignment_method="auto_inferred", confidence=0.9)
+    on_copy = ActionGoalRelationship(action=Action("Track run"), goal=copy, contribution=2.0,
+                                     assignment_method="manual", confidence=1.0)
+
+    plain, smart_progress = aggregate_all_goals([sample_goal, smart], sample_matches + [on_smart, on_copy])
+
+    assert (plain.total_progress, plain.matching_actions_count) == (52.0, 5)
+    assert (smart_progress.total_progress, smart_progress.matches) == (8.0, [on_smart])
+
+
+def test_iter_goal_progress_streams_from_generator(sample_goal, sample_matches):
+    """Progress is yielded lazily in goal order from a one-shot match stream"""
+    other = Goal(title="Swim 10km", measurement_unit="km", measurement_target=10.0)
+
+    stream = iter_goal_progress([sample_goal, other], (m for m in sample_matches))
+    first = next(stream)
+
+    assert (first.goal, first.total_progress) == (sample_goal, 50.0)
+    assert [(p.goal, p.total_progress) for p in stream] == [(other, 0)]
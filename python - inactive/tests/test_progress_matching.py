@@ -0,0 +1,217 @@
+"""
+Tests for action-goal matching business logic.
+
+Covers the observable matching rules in ethica/progress_matching.py:
+period filtering, how_goal_is_actionable unit + keyword checks, and the
+fallback to simple unit matching when hints are missing or malformed.
+
+Written by Claude Code on 2025-10-24
+"""
+
+import pytest
+from datetime import datetime
+from categoriae.actions import Action
+from categoriae.goals import Goal, SmartGoal
+from ethica.progress_matching import (
+    confirm_suggested_match, filter_ambiguous_matches, infer_matches, infer_matches_parallel,
+    iter_matches, matches_with_how_goal_is_actionable
+)
+
+
+# ===== FIXTURES =====
+
+@pytest.fixture
+def yoga_goal():
+    """Goal with structured actionability hints."""
+    return Goal(
+        title="Practice yoga 600 minutes",
+        measurement_unit="minutes",
+        measurement_target=600.0,
+        how_goal_is_actionable='{"units": ["minutes"], "keywords": ["yoga", "pilates"]}'
+    )
+
+
+def make_action(title, measurements, log_time=datetime(2025, 5, 1, 9, 0)):
+    return Action(title, measurement_units_by_amount=measurements, log_time=log_time)
+
+
+# ===== ACTIONABILITY =====
+
+def test_unit_and_keyword_match(yoga_goal):
+    """Action with an allowed unit and a keyword in its title matches"""
+    matched, contribution = matches_with_how_goal_is_actionable(
+        make_action("Morning Yoga class", {"minutes": 30.0}), yoga_goal)
+
+    assert matched
+    assert contribution == 30.0
+
+
+def test_wrong_keyword_does_not_match(yoga_goal):
+    """Same unit but unrelated title is rejected"""
+    matched, contribution = matches_with_how_goal_is_actionable(
+        make_action("Wrote chapter 3", {"minutes": 45.0}), yoga_goal)
+
+    assert not matched
+    assert contribution is None
+
+
+def test_malformed_hints_fall_back_to_unit_match():
+    """Malformed JSON hints fall back to substring unit matching"""
+    goal = Goal(title="Run", measurement_unit="km", how_goal_is_actionable="{not json")
+
+    matched, contribution = matches_with_how_goal_is_actionable(
+        make_action("Anything", {"distance_km": 5.0}), goal)
+
+    assert matched
+    assert contribution == 5.0
+
+
+# ===== INFERENCE =====
+
+def test_infer_matches_respects_smart_goal_period():
+    """Actions outside a SmartGoal's dates are not matched"""
+    goal = SmartGoal(
+        title="Run 100km",
+        measurement_unit="km",
+        measurement_target=100.0,
+        start_date=datetime(2025, 4, 1),
+        target_date=datetime(2025, 6, 1),
+        how_goal_is_relevant="Health",
+        how_goal_is_actionable='{"units": ["km"], "keywords": ["run"]}'
+    )
+    inside = make_action("Run by the river", {"km": 5.0}, datetime(2025, 5, 1))
+    outside = make_action("Run in the park", {"km": 8.0}, datetime(2025, 7, 1))
+
+    matches = infer_matches([inside, outside], [goal])
+
+    assert [m.action for m in matches] == [inside]
+    assert matches[0].contribution == 5.0
+    assert matches[0].assignment_method == 'auto_inferred'
+
+
+def test_infer_matches_pairs_each_action_with_its_goals(yoga_goal):
+    """Each action is matched only against goals whose hints it satisfies"""
+    run_goal = Goal(title="Run", measurement_unit="km",
+                    how_goal_is_actionable='{"units": ["km"], "keywords": ["run"]}')
+    yoga = make_action("Yoga flow", {"minutes": 20.0})
+    run = make_action("Easy run", {"km": 4.0})
+
+    matches = infer_matches([yoga, run], [yoga_goal, run_goal])
+
+    assert {(m.action.title, m.goal.title) for m in matches} == {
+        ("Yoga flow", yoga_goal.title),
+        ("Easy run", "Run"),
+    }
+
+
+def test_filter_ambiguous_matches_consumes_generator(yoga_goal):
+    """Streamed matches are partitioned in one pass"""
+    actions = [make_action("Yoga flow", {"minutes": 20.0}), make_action("Yoga nidra", {"minutes": 10.0})]
+
+    confident, ambiguous = filter_ambiguous_matches(iter_matches(actions, [yoga_goal]))
+
+    assert [m.contribution for m in confident] == [20.0, 10.0]
+    assert ambiguous == []
+
+
+def test_confirm_suggested_match_copy_and_in_place(yoga_goal):
+    """Confirming copies by default and updates the suggestion with in_place=True"""
+    suggested = infer_matches([make_action("Yoga flow", {"minutes": 20.0})], [yoga_goal])[0]
+
+    copy = confirm_suggested_match(suggested)
+    assert copy is not suggested
+    assert suggested.assignment_method == 'auto_inferred'
+
+    same = confirm_suggested_match(suggested, in_place=True)
+    assert same is suggested
+    assert (same.assignment_method, same.confidence) == ('user_confirmed', 1.0)
+
+
+def test_keyword_match_is_caseless():
+    """Keywords and titles are compared casefolded, not just lowercased"""
+    goal = Goal(title="Walk", measurement_unit="km",
+                how_goal_is_actionable='{"units": ["km"], "keywords": ["Straße"]}')
+
+    matched, _ = matches_with_how_goal_is_actionable(
+        make_action("Walked down the STRASSE", {"km": 2.0}), goal)
+
+    assert matched
+
+
+def test_goals_sharing_keywords_all_match():
+    """Goals with identical hints each get their own match for one action"""
+    hints = '{"units": ["km"], "keywords": ["run"]}'
+    goals = [Goal(title=f"Run {n}", measurement_unit="km", how_goal_is_actionable=hints) for n in (1, 2)]
+
+    matches = infer_matches([make_action("Long run", {"km": 12.0})], goals)
+
+    assert [m.goal.title for m in matches] == ["Run 1", "Run 2"]
+
+
+def test_infer_matches_period_boundaries_across_weeks():
+    """Actions on a SmartGoal's first and last day match; the day after does not"""
+    goal = SmartGoal(
+        title="Read 10 books",
+        measurement_unit="books",
+        measurement_target=10.0,
+        start_date=datetime(2025, 1, 1),
+        target_date=datetime(2025, 3, 12),
+        how_goal_is_relevant="Growth",
+        how_goal_is_actionable='{"units": ["books"], "keywords": ["read"]}'
+    )
+    actions = [make_action("Read novel", {"books": 1.0}, when)
+               for when in (datetime(2025, 1, 1), datetime(2025, 3, 12), datetime(2025, 3, 13))]
+
+    matches = infer_matches(actions, [goal])
+
+    assert [m.action.log_time for m in matches] == [datetime(2025, 1, 1), datetime(2025, 3, 12)]
+
+
+def test_iter_matches_confidence_floor(yoga_goal):
+    """Matches below the confidence floor are not yielded"""
+    actions = [make_action("Yoga flow", {"minutes": 20.0})]
+
+    assert len(list(iter_matches(actions, [yoga_goal], min_confidence=0.7))) == 1
+    assert list(iter_matches(actions, [yoga_goal], min_confidence=0.95)) == []
+
+
+def test_infer_matches_parallel_agrees_with_serial(yoga_goal):
+    """Sharded matching returns the same matches, bound to the caller's objects"""
+    run_goal = Goal(title="Run", measurement_unit="km",
+                    how_goal_is_actionable='{"units": ["km"], "keywords": ["run"]}')
+    actions = [make_action(f"{kind} {n}", {unit: float(n)})
+               for n in range(1, 7) for kind, unit in (("Yoga", "minutes"), ("Run", "km"), ("Nap", "minutes"))]
+    goals = [yoga_goal, run_goal]
+
+    parallel = infer_matches_parallel(actions, goals, max_workers=2, min_actions=1)
+    serial = infer_matches(actions, goals)
+
+    assert [(m.action, m.goal, m.contribution) for m in parallel] == \
+        [(m.action, m.goal, m.contribution) for m in serial]
+    assert all(any(m.action is a for a in actions) for m in parallel)
+
+
+def test_single_keyword_goal_matches_substring():
+    """A one-keyword goal matches the keyword anywhere in the title"""
+    goal = Goal(title="Swim", measurement_unit="laps",
+                how_goal_is_actionable='{"units": ["laps"], "keywords": ["swim"]}')
+
+    assert matches_with_how_goal_is_actionable(make_action("Evening swimming", {"laps": 20.0}), goal)[0]
+    assert not matches_with_how_goal_is_actionable(make_action("Evening walk", {"laps": 20.0}), goal)[0]
+
+
+def test_undated_goal_still_matches_outside_dated_goal_periods():
+    """Pruning by the dated goals' span never hides matches for undated goals"""
+    dated = SmartGoal(
+        title="Spring run", measurement_unit="km", measurement_target=50.0,
+        start_date=datetime(2025, 3, 1), target_date=datetime(2025, 5, 31),
+        how_goal_is_relevant="Health", how_goal_is_actionable='{"units": ["km"], "keywords": ["run"]}'
+    )
+    undated = Goal(title="Any run", measurement_unit="km",
+                   how_goal_is_actionable='{"units": ["km"], "keywords": ["run"]}')
+    winter = make_action("Cold run", {"km": 5.0}, datetime(2025, 1, 10))
+    spring = make_action("Warm run", {"km": 6.0}, datetime(2025, 4, 10))
+
+    assert [(m.action, m.goal) for m in infer_matches([winter, spring], [dated])] == [(spring, dated)]
+    assert [(m.action, m.goal) for m in infer_matches([winter, spring], [dated, undated])] == [
+        (winter, undated), (spring, dated), (spring, undated)]
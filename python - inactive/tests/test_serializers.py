@@ -0,0 +1,64 @@
+"""
+Tests for generic dataclass serialization in rhetorica/serializers.py.
+
+Covers the storage round trip: serialize(json_encode=True) followed by
+deserialize(json_decode=True) restores datetimes, UUIDs and JSON fields.
+
+Written by Claude Code on 2025-10-24
+"""
+
+import math
+from datetime import datetime
+
+from categoriae.actions import Action
+from categoriae.goals import SmartGoal
+from rhetorica.serializers import deserialize, serialize
+
+
+def test_action_round_trip_through_storage_form():
+    """Datetimes and the measurements dict come back as Python objects"""
+    action = Action("Run", measurement_units_by_amount={"km": 5.0},
+                    log_time=datetime(2025, 1, 2, 7, 30), duration_minutes=30.0)
+
+    row = serialize(action, include_type=False, json_encode=True)
+    restored = deserialize(row, Action, json_decode=True)
+
+    assert isinstance(row['measurement_units_by_amount'], str)
+    assert restored.measurement_units_by_amount == {"km": 5.0}
+    assert restored.log_time == datetime(2025, 1, 2, 7, 30)
+    assert restored.uuid_id == action.uuid_id
+
+
+def test_deserialize_decodes_json_only_on_request():
+    """JSON text is decoded only with json_decode; dates are parsed regardless"""
+    action = Action("Run", measurement_units_by_amount={"km": 5.0}, log_time=datetime(2025, 3, 1))
+    row = serialize(action, include_type=False, json_encode=True)
+
+    restored = deserialize(row, Action)
+
+    assert restored.measurement_units_by_amount == '{"km": 5.0}'
+    assert restored.log_time == datetime(2025, 3, 1)
+
+
+def test_string_field_holding_json_is_not_decoded():
+    """Only dict/list-annotated fields are decoded; Optional[str] text stays text"""
+    goal = SmartGoal(title="Run 50km", measurement_unit="km", measurement_target=50.0,
+                     start_date=datetime(2025, 3, 1), target_date=datetime(2025, 5, 31),
+                     how_goal_is_relevant="Health", how_goal_is_actionable='{"units": ["km"]}')
+
+    restored = deserialize(serialize(goal, include_type=False, json_encode=True), SmartGoal, json_decode=True)
+
+    assert restored.how_goal_is_actionable == '{"units": ["km"]}'
+    assert restored.target_date == datetime(2025, 5, 31)
+
+
+def test_json_fields_decode_values_outside_strict_json():
+    """NaN and integers wider than 64 bits decode as json.loads would"""
+    action = Action("Run", log_time=datetime(2025, 3, 1))
+    row = serialize(action, include_type=False, json_encode=True)
+    row['measurement_units_by_amount'] = '{"km": NaN, "steps": 18446744073709551616}'
+
+    restored = deserialize(row, Action, json_decode=True)
+
+    assert restored.measurement_units_by_amount["steps"] == 2 ** 64
+    assert math.isnan(restored.measurement_units_by_amount["km"])
@@ -0,0 +1,172 @@
+"""
+Tests for term/goal association rules in ethica/term_lifecycle.py.
+
+Covers explicit commitment, date overlap, and unassigned goal detection.
+
+Written by Claude Code on 2025-10-24
+"""
+
+import pytest
+from datetime import datetime
+from categoriae.goals import Goal
+from categoriae.terms import GoalTerm, frozen_now
+from ethica.term_lifecycle import (
+    calculate_target_date_from_duration,
+    get_all_term_goals,
+    get_committed_goals,
+    get_overlapping_goals,
+    get_term_status,
+    get_terms_by_status,
+    get_unassigned_goals,
+    is_term_complete,
+    is_term_upcoming,
+    prepare_terms_list_view,
+    validate_goal_term_assignment,
+)
+
+
+def make_goal(goal_id, start=None, target=None):
+    goal = Goal(title=f"Goal {goal_id}", start_date=start, target_date=target)
+    goal.id = goal_id
+    return goal
+
+
+def make_term(number, goal_ids):
+    return GoalTerm(title=f"Term {number}", term_number=number,
+                    start_date=datetime(2025, 1, 1), target_date=datetime(2025, 3, 12),
+                    term_goals_by_id=list(goal_ids))
+
+
+def test_committed_and_overlapping_goals_are_disjoint():
+    """Committed goals are excluded from the overlapping list"""
+    committed = make_goal(1, datetime(2025, 1, 5), datetime(2025, 2, 1))
+    overlapping = make_goal(2, datetime(2024, 12, 1), datetime(2025, 1, 1))
+    outside = make_goal(3, datetime(2025, 4, 1), datetime(2025, 5, 1))
+    undated = make_goal(4)
+    term = make_term(1, [1])
+    goals = [committed, overlapping, outside, undated]
+
+    assert get_committed_goals(term, goals) == [committed]
+    assert get_all_term_goals(term, goals) == {
+        'committed': get_committed_goals(term, goals),
+        'overlapping': get_overlapping_goals(term, goals),
+    }
+    assert get_overlapping_goals(term, goals) == [overlapping]
+
+
+def test_unassigned_goals_across_terms():
+    """Goals not committed to any term are reported in input order"""
+    goals = [make_goal(n) for n in (1, 2, 3, 4)]
+    terms = [make_term(1, [1]), make_term(2, [3])]
+
+    assert [g.id for g in get_unassigned_goals(goals, terms)] == [2, 4]
+    assert get_unassigned_goals(goals, []) == goals
+
+
+def test_validate_assignment_of_undated_and_disjoint_goals():
+    """Undated goals always fit a term; dated goals must overlap it"""
+    term = make_term(1, [])
+
+    assert validate_goal_term_assignment(make_goal(1), term) == (True, None)
+    assert validate_goal_term_assignment(make_goal(2, datetime(2025, 1, 5)), term) == (True, None)
+    valid, warning = validate_goal_term_assignment(
+        make_goal(3, datetime(2025, 4, 1), datetime(2025, 5, 1)), term)
+    assert not valid and "don't overlap" in warning
+    # Same calendar day as the term's end, but after it
+    valid, _ = validate_goal_term_assignment(
+        make_goal(4, datetime(2025, 3, 12, 9, 0), datetime(2025, 4, 1)), term)
+    assert not valid
+
+
+def test_term_status_boundaries():
+    """Start and target dates are inclusive in the active window"""
+    term = make_term(1, [])
+
+    assert get_term_status(term, datetime(2024, 12, 31)) == 'upcoming'
+    assert get_term_status(term, datetime(2025, 1, 1)) == 'active'
+    assert get_term_status(term, datetime(2025, 3, 12)) == 'active'
+    assert get_term_status(term, datetime(2025, 3, 13)) == 'complete'
+    assert is_term_upcoming(term, datetime(2024, 12, 31))
+    assert is_term_complete(term, datetime(2025, 3, 13))
+
+
+def test_term_predicates_compare_one_bound_each():
+    """is_term_complete only checks target_date, even when the dates are inverted"""
+    term = make_term(1, [])
+    term.start_date, term.target_date = term.target_date, term.start_date
+    check = datetime(2025, 2, 1)
+
+    assert get_term_status(term, check) == 'upcoming'
+    assert is_term_upcoming(term, check)
+    assert is_term_complete(term, check)
+
+
+def test_terms_list_view_counts_known_committed_goals():
+    """Committed goal counts skip unknown and repeated IDs"""
+    goals = [make_goal(n) for n in (1, 2, 3)]
+    term = make_term(1, [3, 1, 3, 99])
+
+    rows = prepare_terms_list_view([term, make_term(2, [])], goals, datetime(2025, 2, 1))
+    assert {row.term.term_number: row.committed_goal_count for row in rows} == {1: 2, 2: 0}
+
+
+def test_terms_list_view_only_reports_progress_for_active_terms():
+    """days_remaining/progress_percent follow the classified status"""
+    term = make_term(1, [])
+    active, complete = (prepare_terms_list_view([term], [], check)[0]
+                        for check in (datetime(2025, 2, 1), datetime(2025, 4, 1)))
+
+    assert (active.status, active.days_remaining) == ('active', 39)
+    assert (complete.status, complete.days_remaining, complete.progress_percent) == ('complete', None, None)
+
+
+def test_committed_goals_follow_in_place_changes():
+    """Appending to or removing from term_goals_by_id is seen by the next lookup"""
+    goals = [make_goal(1), make_goal(2)]
+    term = make_term(1, [1])
+
+    term.term_goals_by_id.append(2)
+    assert get_committed_goals(term, goals) == goals
+
+    term.term_goals_by_id.remove(1)
+    assert get_committed_goals(term, goals) == [goals[1]]
+    assert get_unassigned_goals(goals, [term]) == [goals[0]]
+
+
+def test_target_date_from_duration_units():
+    """Each unit scales from the start date; months are 30 days; unknown units raise"""
+    start = datetime(2025, 1, 1)
+
+    assert calculate_target_date_from_duration(start, 10, 'weeks') == datetime(2025, 3, 12)
+    assert calculate_target_date_from_duration(start, 2, 'months') == datetime(2025, 3, 2)
+    assert calculate_target_date_from_duration(start, 90, 'minutes') == datetime(2025, 1, 1, 1, 30)
+    with pytest.raises(ValueError):
+        calculate_target_date_from_duration(start, 1, 'years')
+
+
+def test_status_defaults_follow_frozen_now():
+    """Without a check_date, term helpers read the instant pinned by frozen_now()"""
+    term = make_term(1, [])
+
+    with frozen_now(datetime(2025, 2, 1)):
+        assert get_term_status(term) == 'active'
+        assert get_terms_by_status([term], 'active') == [term]
+    with frozen_now(datetime(2025, 6, 1)):
+        assert is_term_complete(term)
+
+
+def test_terms_list_view_orders_active_first_then_newest():
+    """Active terms lead; the rest follow by descending term number"""
+    def term(number, start, target):
+        return GoalTerm(title=f"T{number}", term_number=number, start_date=start, target_date=target)
+
+    terms = [
+        term(1, datetime(2024, 1, 1), datetime(2024, 3, 1)),
+        term(3, datetime(2025, 1, 1), datetime(2025, 3, 1)),
+        term(4, datetime(2025, 6, 1), datetime(2025, 8, 1)),
+        term(2, datetime(2024, 6, 1), datetime(2024, 8, 1)),
+    ]
+
+    rows = prepare_terms_list_view(terms, [], datetime(2025, 2, 1))
+
+    assert [row.term.term_number for row in rows] == [3, 4, 2, 1]
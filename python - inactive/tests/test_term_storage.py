@@ -0,0 +1,41 @@
+"""
+Test term storage functionality using the rhetorica layer.
+
+Covers narrowing terms to those covering a moment in SQL via
+TermStorageService.get_spanning().
+
+Written by Claude Code on 2025-10-24
+"""
+
+from datetime import datetime
+from categoriae.terms import GoalTerm
+from rhetorica.serializers import serialize
+from rhetorica.storage_service import TermStorageService
+
+
+def test_get_spanning_returns_covering_terms(test_db):
+    """Only terms whose date range contains the moment are loaded, bounds inclusive"""
+    db, _ = test_db
+    service = TermStorageService(database=db)
+    service.store_many_instances([
+        GoalTerm(term_number=1, start_date=datetime(2025, 1, 1), target_date=datetime(2025, 3, 12)),
+        GoalTerm(term_number=2, start_date=datetime(2025, 3, 13), target_date=datetime(2025, 5, 21)),
+    ])
+
+    assert [t.term_number for t in service.get_spanning(datetime(2025, 2, 1))] == [1]
+    assert [t.term_number for t in service.get_spanning(datetime(2025, 5, 21))] == [2]
+    assert service.get_spanning(datetime(2025, 6, 1)) == []
+
+
+def test_get_spanning_matches_space_separated_dates(test_db):
+    """Rows written as 'YYYY-MM-DD HH:MM:SS' (as the Swift app does) still cover their last day"""
+    db, _ = test_db
+    term = GoalTerm(term_number=1, start_date=datetime(2025, 3, 13), target_date=datetime(2025, 5, 21))
+    row = serialize(term, include_type=False, json_encode=True)
+    row.update(start_date='2025-03-13 00:00:00', target_date='2025-05-21 00:00:00')
+    db.insert('terms', [row])
+    service = TermStorageService(database=db)
+
+    assert [t.term_number for t in service.get_spanning(datetime(2025, 5, 21))] == [1]
+    assert [t.term_number for t in service.get_spanning(datetime(2025, 3, 13))] == [1]
+    assert service.get_spanning(datetime(2025, 5, 21, 0, 0, 1)) == []
@@ -0,0 +1,75 @@
+"""
+Tests for GoalTerm time calculations in categoriae/terms.py
+
+Written by Claude Code on 2025-10-24
+
+Testing philosophy:
+1. Test observable results (progress, active state), not cached internals
+2. Test that rescheduling a term is reflected immediately
+"""
+from datetime import datetime
+
+from categoriae.terms import GoalTerm, YearlyPlan, frozen_now
+
+
+def test_progress_percentage_tracks_rescheduled_dates():
+    """Reassigning start/target dates should change progress immediately"""
+    term = GoalTerm(term_number=1,
+                    start_date=datetime(2025, 1, 1),
+                    target_date=datetime(2025, 1, 11))
+    check = datetime(2025, 1, 6)
+    assert term.progress_percentage(check) == 0.5
+
+    term.target_date = datetime(2025, 1, 21)
+    assert term.progress_percentage(check) == 0.25
+
+
+def test_progress_percentage_counts_full_days_elapsed():
+    """Elapsed days are whole 24-hour periods since start, not calendar dates crossed"""
+    term = GoalTerm(term_number=1,
+                    start_date=datetime(2025, 1, 1, 23, 0),
+                    target_date=datetime(2025, 1, 11, 23, 0))
+
+    assert term.progress_percentage(datetime(2025, 1, 2, 8, 0)) == 0.0
+    assert term.progress_percentage(datetime(2025, 1, 2, 23, 0)) == 0.1
+
+
+def test_frozen_now_pins_current_time():
+    """Terms evaluated inside frozen_now() agree on a single instant"""
+    term = GoalTerm(term_number=1,
+                    start_date=datetime(2025, 1, 1),
+                    target_date=datetime(2025, 3, 11))
+
+    with frozen_now(datetime(2025, 2, 1)):
+        assert term.is_active()
+        assert term.days_remaining() == 38
+
+    with frozen_now(datetime(2025, 6, 1)):
+        assert not term.is_active()
+        assert term.progress_percentage() == 1.0
+
+
+def test_yearly_plan_finds_current_term_regardless_of_insert_order():
+    """get_current_term should work for terms added out of order"""
+    plan = YearlyPlan(title="2025")
+    for n, month in ((3, 7), (1, 1), (2, 4)):
+        plan.add_term(GoalTerm(term_number=n,
+                               start_date=datetime(2025, month, 1),
+                               target_date=datetime(2025, month + 2, 20)))
+
+    assert [t.term_number for t in plan.terms] == [1, 2, 3]
+    assert plan.get_current_term(datetime(2025, 5, 10)).term_number == 2
+    assert plan.get_current_term(datetime(2025, 6, 25)) is None
+    assert plan.get_current_term(datetime(2024, 12, 1)) is None
+
+
+def test_yearly_plan_leaves_callers_list_unsorted():
+    """YearlyPlan sorts a copy of the terms it is given"""
+    later = GoalTerm(term_number=2, start_date=datetime(2025, 4, 1), target_date=datetime(2025, 6, 9))
+    earlier = GoalTerm(term_number=1, start_date=datetime(2025, 1, 1), target_date=datetime(2025, 3, 11))
+    terms = [later, earlier]
+
+    plan = YearlyPlan(title="2025", terms=terms)
+
+    assert terms == [later, earlier]
+    assert [t.term_number for t in plan.terms] == [1, 2]
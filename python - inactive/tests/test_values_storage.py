@@ -7,6 +7,8 @@ HighestOrderValues are saved and retrieved as the correct subclass types.
 Written by Claude Code on 2025-10-11
 """
 
+import pytest
+
 from categoriae.values import Values, MajorValues, HighestOrderValues, PriorityLevel
 from rhetorica.storage_service import ValuesStorageService
 
@@ -54,4 +56,15 @@ def test_values_polymorphic_roundtrip(test_db):
             assert value.alignment_guidance is not None
         elif value.title == "Truth":
             assert isinstance(value, HighestOrderValues)
-            assert value.incentive_type == 'highest_order'
\ No newline at end of file
+            assert value.incentive_type == 'highest_order'
+
+
+def test_create_value_rejects_out_of_range_priority(test_db):
+    """Priorities from user input are range-checked where the value is built"""
+    db, _ = test_db
+    service = ValuesStorageService(database=db)
+
+    with pytest.raises(ValueError, match="must be between 1 and 100"):
+        service.create_value('general', 'Compassion', 'Care for others', priority=0)
+
+    assert service.create_value('general', 'Compassion', 'Care for others', priority=30).priority == 30